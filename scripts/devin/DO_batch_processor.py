@@ -15,7 +15,8 @@ Key Functions:
     dispatch_threads: Dispatch multiple batches to parallel worker threads.
 """
 
-import time
+import logging
+import queue
 import threading
 from typing import Any, TYPE_CHECKING
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -23,18 +24,16 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from .DO_models import SessionStatus, SessionResult, OrchestratorState
 from .DO_gh_alerts_control_center import claim_github_alerts
 from .DO_prompts import create_devin_prompt
-from .DO_session import create_devin_session, poll_session_status
+from .DO_session import create_devin_session, poll_session_status, cancel_polling, reset_polling
 from .DO_outcomes import handle_session_outcome
-from .DO_config import MAX_WORKERS_DEFAULT, MAX_ACTIVE_SESSIONS
-
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from termination_logic import send_sleep_message
+from .DO_config import MAX_WORKERS_DEFAULT, MAX_ACTIVE_SESSIONS, get_run_id
+from scripts.termination_logic import send_sleep_message
 
 if TYPE_CHECKING:
     from scripts.slack_client import SentinelDashboard
 
+log = logging.getLogger(__name__)
+
 def extract_alert_numbers(batch_data: dict[str, Any]) -> list[int]:
     """
     Extract alert numbers from batch data.
@@ -52,54 +51,61 @@ def extract_alert_numbers(batch_data: dict[str, Any]) -> list[int]:
     """
     tasks = batch_data.get("tasks", [])
     alert_numbers = [
-        task.get("alert_number") 
-        for task in tasks 
-        if task.get("alert_number") is not None
+        alert_number
+        for task in tasks
+        if (alert_number := task.get("alert_number")) is not None
     ]
     return alert_numbers
 
 def process_batch(
     batch_id: str,
     batch_data: dict[str, Any],
+    alert_numbers: list[int],
     owner: str,
     repo: str,
     state: OrchestratorState,
-    session_semaphore: threading.Semaphore | None = None,
-    dashboard: "SentinelDashboard | None" = None
+    session_semaphore: threading.BoundedSemaphore | None = None,
+    dashboard: "SentinelDashboard | None" = None,
+    run_id: str | None = None,
+    prompt: str | None = None
 ) -> SessionResult:
     """
     Process a single remediation batch end-to-end.
     
     This function is executed by worker threads and handles:
-    1. Acquiring a session slot (via semaphore)
-    2. Extracting alert numbers from batch data
+    1. Claiming the batch's alerts
+    2. Acquiring a session slot (via semaphore)
     3. Starting a Devin session
     4. Polling for completion
-    5. Terminating the session to free the slot
-    6. Handling the final outcome
+    5. Sending the sleep message and releasing the session slot
+    6. Handling the final outcome (after the slot is released, so the next
+       batch can start its session while this one updates GitHub)
     
     Args:
         batch_id: The vulnerability rule ID (batch identifier)
         batch_data: Batch data containing severity and tasks with alert_number fields
+        alert_numbers: Alert numbers of the batch, pre-extracted by dispatch_threads
         owner: GitHub repository owner
         repo: GitHub repository name
         state: Shared orchestrator state for tracking
         session_semaphore: Optional semaphore to limit concurrent active sessions
         dashboard: Optional SentinelDashboard for Slack updates
+        run_id: Identifier of the current run, used in the session idempotency
+                key (default: a fresh get_run_id())
+        prompt: Prebuilt Devin prompt (default: built with build_batch_prompt())
     
     Returns:
         SessionResult with final status and details
     """
-    print(f"\n[Batch] Processing batch: {batch_id}")
+    log.info("[Batch] Processing batch: %s", batch_id)
     
     tasks = batch_data.get("tasks", [])
     severity = batch_data.get("severity", 0)
-    alert_numbers = extract_alert_numbers(batch_data)
     
-    print(f"[Batch] Batch {batch_id}: {len(tasks)} tasks, severity {severity}, alerts: {alert_numbers}")
+    log.info("[Batch] Batch %s: %s tasks, severity %s, alerts: %s", batch_id, len(tasks), severity, alert_numbers)
     
     if not alert_numbers:
-        print(f"[Batch] No alerts found in batch {batch_id}")
+        log.info("[Batch] No alerts found in batch %s", batch_id)
         return SessionResult(
             status=SessionStatus.FAILURE,
             session_id="",
@@ -108,14 +114,14 @@ def process_batch(
             error_message="No alerts found in batch data"
         )
     
-    print(f"[Batch] Claiming {len(alert_numbers)} alerts for batch {batch_id}")
+    log.info("[Batch] Claiming %s alerts for batch %s", len(alert_numbers), batch_id)
     claim_results = claim_github_alerts(owner, repo, alert_numbers)
     
     claimed_alerts = [num for num, success in claim_results.items() if success]
     failed_claims = [num for num, success in claim_results.items() if not success]
     
     if not claimed_alerts:
-        print(f"[Batch] Failed to claim any alerts for batch {batch_id}, skipping")
+        log.warning("[Batch] Failed to claim any alerts for batch %s, skipping", batch_id)
         return SessionResult(
             status=SessionStatus.FAILURE,
             session_id="",
@@ -125,31 +131,23 @@ def process_batch(
         )
     
     if failed_claims:
-        print(f"[Batch] Warning: Could not claim alerts {failed_claims}, proceeding with {len(claimed_alerts)} claimed alerts")
+        log.warning("[Batch] Could not claim alerts %s, proceeding with %s claimed alerts", failed_claims, len(claimed_alerts))
         alert_numbers = claimed_alerts
     
-    task_description = f"Fix {len(tasks)} security vulnerabilities of type '{batch_id}' with severity {severity}"
-    
-    prompt = create_devin_prompt(
-        task_description=task_description,
-        batch_data=batch_data,
-        batch_id=batch_id,
-        owner=owner,
-        repo=repo
-    )
+    prompt = prompt or build_batch_prompt(batch_id, batch_data, owner, repo)
     
     if session_semaphore:
-        print(f"[Batch] Waiting for session slot for batch {batch_id}...")
+        log.info("[Batch] Waiting for session slot for batch %s...", batch_id)
         session_semaphore.acquire()
-        print(f"[Batch] Acquired session slot for batch {batch_id}")
+        log.info("[Batch] Acquired session slot for batch %s", batch_id)
     
     session_id = ""
     try:
-        idempotency_key = f"sentinel-{owner}-{repo}-{batch_id}-{int(time.time())}"
+        idempotency_key = f"sentinel-{owner}-{repo}-{batch_id}-{run_id or get_run_id()}"
         session_response = create_devin_session(prompt, idempotency_key)
         
         if not session_response:
-            print(f"[Batch] Failed to create Devin session for batch {batch_id}")
+            log.error("[Batch] Failed to create Devin session for batch %s", batch_id)
             return SessionResult(
                 status=SessionStatus.FAILURE,
                 session_id="",
@@ -160,7 +158,7 @@ def process_batch(
         
         session_id = session_response.get("session_id", "")
         session_url = session_response.get("url")
-        print(f"[Batch] Devin session created: {session_id} for batch {batch_id}")
+        log.info("[Batch] Devin session created: %s for batch %s", session_id, batch_id)
         
         if dashboard:
             dashboard.update(batch_id, "Started", session_id=session_id, session_url=session_url)
@@ -170,29 +168,61 @@ def process_batch(
         if dashboard:
             dashboard.update(batch_id, "Analyzing...", session_id=session_id, session_url=session_url)
         
-        result = poll_session_status(session_id, session_url=session_url)
-        
-        result.batch_id = batch_id
-        result.alert_numbers = alert_numbers
-        
-        result = handle_session_outcome(result, owner, repo)
-        
-        state.add_result(result)
-        
-        final_status = f"Completed: {result.status.value}"
-        if dashboard:
-            dashboard.update(batch_id, final_status, session_id=session_id, pr_url=result.pr_url, session_url=result.session_url)
-        
-        return result
+        result = poll_session_status(
+            session_id,
+            session_url=session_url,
+            owner=owner,
+            repo=repo,
+            batch_id=batch_id,
+            alert_numbers=alert_numbers
+        )
     
     finally:
         if session_id:
-            print(f"[Batch] Sending sleep message to session {session_id} for batch {batch_id}")
+            log.info("[Batch] Sending sleep message to session %s for batch %s", session_id, batch_id)
             send_sleep_message(session_id)
         
         if session_semaphore:
             session_semaphore.release()
-            print(f"[Batch] Released session slot for batch {batch_id}")
+            log.info("[Batch] Released session slot for batch %s", batch_id)
+    
+    # The session is finished, so its slot is already free for the next batch
+    # while this thread reconciles the alerts on GitHub.
+    result = handle_session_outcome(result, owner, repo)
+    
+    state.add_result(result)
+    
+    final_status = f"Completed: {result.status.value}"
+    if dashboard:
+        dashboard.update(batch_id, final_status, session_id=session_id, pr_url=result.pr_url, session_url=result.session_url)
+    
+    return result
+
+
+def build_batch_prompt(batch_id: str, batch_data: dict[str, Any], owner: str, repo: str) -> str:
+    """
+    Build the Devin remediation prompt for one batch.
+    
+    Args:
+        batch_id: The batch identifier (typically the rule ID)
+        batch_data: Batch data with severity and tasks
+        owner: GitHub repository owner
+        repo: GitHub repository name
+    
+    Returns:
+        The XML-formatted prompt
+    """
+    tasks = batch_data.get("tasks", [])
+    severity = batch_data.get("severity", 0)
+    task_description = f"Fix {len(tasks)} security vulnerabilities of type '{batch_id}' with severity {severity}"
+    
+    return create_devin_prompt(
+        task_description=task_description,
+        batch_data=batch_data,
+        batch_id=batch_id,
+        owner=owner,
+        repo=repo
+    )
 
 
 def dispatch_threads(
@@ -201,75 +231,133 @@ def dispatch_threads(
     repo: str,
     max_workers: int = MAX_WORKERS_DEFAULT,
     available_session_slots: int = MAX_ACTIVE_SESSIONS,
-    dashboard: "SentinelDashboard | None" = None
+    dashboard: "SentinelDashboard | None" = None,
+    run_id: str | None = None,
+    prompts: dict[str, str] | None = None
 ) -> list[SessionResult]:
     """
     Dispatch remediation batches to parallel worker threads.
     
-    Uses ThreadPoolExecutor to process batches concurrently while
-    enforcing a conservative max_workers limit to avoid API rate limits.
-    Uses a semaphore to limit concurrent active Devin sessions.
+    Uses ThreadPoolExecutor to process batches concurrently and a bounded
+    semaphore to limit concurrent active Devin sessions. The pool has at
+    least as many threads as session slots, so threads waiting on the
+    semaphore never leave a free slot unused. The Devin API allows only
+    MAX_ACTIVE_SESSIONS sessions at once, so the thread count stays small;
+    the threads spend their time blocked in I/O or in poll waits, and status
+    reads are shared through one session-list snapshot (see DO_session).
     
-    Each thread:
-    1. Acquires a session slot (via semaphore)
-    2. Extracts alert numbers from batch data
-    3. Starts a Devin session
-    4. Polls for completion
-    5. Sends sleep message to session (preserves session for later review)
-    6. Handles the final outcome
+    Alert numbers are extracted for every batch once, up front, before any
+    work starts. Batches are queued in descending severity order so the most
+    critical ones reach a worker and a session slot first. Each worker thread
+    takes one batch at a time from the queue, so only the running batches
+    hold any per-batch state and an interrupt simply stops the rest from
+    being taken; results are collected as they complete. For each batch the
+    worker:
+    1. Claims the batch's alerts and acquires a session slot (via semaphore)
+    2. Starts a Devin session
+    3. Polls for completion
+    4. Sends sleep message to session (preserves session for later review)
+       and releases its session slot
+    5. Handles the final outcome outside the slot
     
     Args:
         batches: Dictionary of remediation batches {batch_id: batch_data}
         owner: GitHub repository owner
         repo: GitHub repository name
-        max_workers: Maximum concurrent threads (default: 3)
+        max_workers: Preferred number of worker threads (default: 3); raised to
+                     available_session_slots and capped at the batch count
         available_session_slots: Number of available session slots (default: MAX_ACTIVE_SESSIONS)
         dashboard: Optional SentinelDashboard for Slack updates
+        run_id: Identifier shared by every batch of this run (default: get_run_id())
+        prompts: Optional prebuilt prompts by batch_id (see build_batch_prompt);
+                 batches without one build their prompt in the worker
     
     Returns:
         List of SessionResult objects for all processed batches
     """
     if not batches:
-        print("[Dispatch] No batches to process")
+        log.info("[Dispatch] No batches to process")
         return []
     
-    print(f"\n[Dispatch] Starting parallel processing of {len(batches)} batches with {max_workers} workers")
-    print(f"[Dispatch] Available session slots: {available_session_slots}")
+    # Never start more threads than there are batches, and never fewer than
+    # the session slots so every free slot can be filled.
+    worker_count = min(len(batches), max(max_workers, available_session_slots))
     
+    log.info("[Dispatch] Starting parallel processing of %s batches with %s workers", len(batches), worker_count)
+    log.info("[Dispatch] Available session slots: %s", available_session_slots)
+    
+    run_id = run_id or get_run_id()
     state = OrchestratorState()
     results: list[SessionResult] = []
     
-    session_semaphore = threading.Semaphore(available_session_slots)
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_batch = {
-            executor.submit(
-                process_batch,
-                batch_id,
-                batch_data,
-                owner,
-                repo,
-                state,
-                session_semaphore,
-                dashboard
-            ): batch_id
-            for batch_id, batch_data in batches.items()
-        }
-        
-        for future in as_completed(future_to_batch):
-            batch_id = future_to_batch[future]
+    session_semaphore = threading.BoundedSemaphore(available_session_slots)
+    
+    # An interrupted earlier dispatch in this process leaves polling cancelled
+    reset_polling()
+    
+    batch_alerts = {
+        batch_id: extract_alert_numbers(batch_data)
+        for batch_id, batch_data in batches.items()
+    }
+    
+    # Workers take batches from the queue in order, so putting the most
+    # severe batches first lets them take the scarce session slots first.
+    prioritized = sorted(
+        batches.items(),
+        key=lambda item: item[1].get("severity") or 0,
+        reverse=True
+    )
+    pending: queue.SimpleQueue[tuple[str, dict[str, Any]]] = queue.SimpleQueue()
+    for item in prioritized:
+        pending.put(item)
+    stop = threading.Event()
+    
+    def run_worker() -> None:
+        """Process queued batches until the queue is empty or dispatch stops."""
+        while not stop.is_set():
+            try:
+                batch_id, batch_data = pending.get_nowait()
+            except queue.Empty:
+                return
             try:
-                result = future.result()
-                results.append(result)
-                print(f"[Dispatch] Batch {batch_id} completed with status: {result.status.value}")
+                result = process_batch(
+                    batch_id,
+                    batch_data,
+                    batch_alerts[batch_id],
+                    owner,
+                    repo,
+                    state,
+                    session_semaphore,
+                    dashboard,
+                    run_id,
+                    (prompts or {}).get(batch_id)
+                )
+                log.info("[Dispatch] Batch %s completed with status: %s", batch_id, result.status.value)
             except Exception as e:
-                print(f"[Dispatch] Batch {batch_id} raised exception: {e}")
-                results.append(SessionResult(
+                log.error("[Dispatch] Batch %s raised exception: %s", batch_id, e)
+                result = SessionResult(
                     status=SessionStatus.FAILURE,
                     session_id="",
                     batch_id=batch_id,
                     alert_numbers=[],
                     error_message=str(e)
-                ))
+                )
+            results.append(result)
+    
+    executor = ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="batch")
+    try:
+        workers = [executor.submit(run_worker) for _ in range(worker_count)]
+        for worker in as_completed(workers):
+            worker.result()
+    except KeyboardInterrupt:
+        # Stop handing out batches and wake the sleeping pollers so the
+        # running ones wind down (sleep message, slot release) right away.
+        log.warning("[Dispatch] Interrupted, cancelling pending batches and polling")
+        stop.set()
+        cancel_polling()
+        executor.shutdown(wait=True)
+        raise
+    finally:
+        executor.shutdown(wait=True)
     
     return results
@@ -15,9 +15,15 @@ Configuration Categories:
 Environment Variables:
     DEVIN_API_KEY: API key for Devin AI authentication.
     GH_TOKEN: GitHub Personal Access Token with security_events scope.
+    GH_TOKENS: Optional comma-separated extra GitHub tokens used to spread
+               alert-management traffic across several rate-limit budgets.
+    GITHUB_RUN_ID: Set by GitHub Actions; used as the run identifier in Devin
+                   session idempotency keys.
 """
 
+import functools
 import os
+import uuid
 
 # Devin AI API Configuration
 DEVIN_API_BASE = "https://api.devin.ai/v1"
@@ -26,9 +32,21 @@ DEVIN_API_BASE = "https://api.devin.ai/v1"
 GITHUB_API_BASE = "https://api.github.com"
 
 # Session Polling Configuration
-POLL_INTERVAL_SECONDS = 150  # Time between status checks
+POLL_INTERVAL_SECONDS = 150  # Maximum time between status checks
+POLL_INITIAL_INTERVAL_SECONDS = 10  # First wait; doubles each poll up to POLL_INTERVAL_SECONDS
+POLL_JITTER_SECONDS = 5  # Random extra wait so concurrent pollers do not fire in lockstep
+POLL_RETRY_BACKOFF_FACTOR = 1.3  # Growth of the retry wait per consecutive failed status check
 SESSION_TIMEOUT_SECONDS = 15 * 60  # 15 minutes max wait time
 STAGNATION_THRESHOLD_SECONDS = 5 * 60  # 5 minutes without activity = stuck
+POLL_HISTORY_FILENAME = "devin_poll_history.json"  # Past completion times, kept in SENTINEL_CACHE_DIR or the temp dir
+POLL_HISTORY_MIN_SAMPLES = 10  # Completions needed before polls follow the observed distribution
+POLL_HISTORY_MAX_SAMPLES = 200  # Most recent completions kept in the history file
+PR_LOOKUP_TIMEOUT_SECONDS = 15  # Longest a poll waits on the GitHub PR search before treating it as "no PR yet"
+SESSION_LIST_CACHE_TTL_SECONDS = 30  # Age at which the shared session-list snapshot is refreshed
+
+# Devin API Retry Configuration
+DEVIN_RETRY_ATTEMPTS = 3  # Retries of a Devin request after a 429, 5xx or connection error
+DEVIN_RETRY_BACKOFF_SECONDS = 2  # Base delay between those retries (exponential backoff)
 
 # Batch Processing Configuration
 MAX_WORKERS_DEFAULT = 4  # Maximum concurrent worker threads
@@ -36,15 +54,29 @@ MAX_WORKERS_DEFAULT = 4  # Maximum concurrent worker threads
 # Alert Claiming Configuration
 CLAIM_RETRY_ATTEMPTS = 3  # Number of retries for failed claims
 CLAIM_RETRY_DELAY_SECONDS = 2  # Base delay between retries (exponential backoff)
+CLAIM_RETRY_JITTER_SECONDS = 1  # Random extra retry delay so concurrent PATCHes do not retry in lockstep
+CLAIM_MAX_WORKERS = 8  # Maximum concurrent alert update requests across all batches
+TOKEN_MIN_REMAINING = 50  # Rest a pooled token once fewer requests than this remain
+RATE_LIMIT_MAX_WAIT_SECONDS = 60  # Longest wait for a resting token before sending anyway
 
 # Active Session Management
 MAX_ACTIVE_SESSIONS = 5  # Maximum concurrent Devin sessions allowed by API
 
+# HTTP Connection Pooling
+HTTP_POOL_CONNECTIONS = 4  # Hosts kept in each shared session's pool
+HTTP_POOL_MAXSIZE = 16  # Keep-alive connections per host (>= concurrent threads)
+KEEPALIVE_IDLE_TTL_SECONDS = 50  # Drop pooled connections idle longer than this (servers close them at ~60s)
+
 
+@functools.lru_cache(maxsize=1)
 def get_devin_api_key() -> str:
     """
     Retrieve the Devin API key from environment variables.
     
+    The value is read once and cached for the life of the process (a missing
+    key is not cached). Call get_devin_api_key.cache_clear() after changing
+    the environment.
+    
     Returns:
         The DEVIN_API_KEY environment variable value.
         
@@ -57,10 +89,15 @@ def get_devin_api_key() -> str:
     return key
 
 
+@functools.lru_cache(maxsize=1)
 def get_github_token() -> str:
     """
     Retrieve the GitHub token from environment variables.
     
+    The value is read once and cached for the life of the process (a missing
+    token is not cached). Call get_github_token.cache_clear() after changing
+    the environment.
+    
     Returns:
         The GH_TOKEN environment variable value.
         
@@ -71,3 +108,39 @@ def get_github_token() -> str:
     if not token:
         raise ValueError("GH_TOKEN environment variable is not set")
     return token
+
+
+def get_github_tokens() -> list[str]:
+    """
+    Retrieve every GitHub token available for alert management.
+    
+    The primary GH_TOKEN always comes first, followed by any additional
+    tokens listed in GH_TOKENS. Duplicates and blanks are dropped.
+    
+    Returns:
+        Ordered list of distinct GitHub tokens.
+        
+    Raises:
+        ValueError: If GH_TOKEN is not set.
+    """
+    tokens = [get_github_token()]
+    for token in os.getenv("GH_TOKENS", "").split(","):
+        token = token.strip()
+        if token and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def get_run_id() -> str:
+    """
+    Return an identifier for the current Sentinel run.
+    
+    Inside GitHub Actions this is GITHUB_RUN_ID, which stays the same across
+    re-runs of a workflow so a retried batch reuses its Devin session via the
+    idempotency key. Elsewhere a random UUID is generated per call, so callers
+    should obtain it once per run and pass it along.
+    
+    Returns:
+        Run identifier string.
+    """
+    return os.getenv("GITHUB_RUN_ID") or uuid.uuid4().hex
@@ -13,27 +13,230 @@ Key Functions:
     claim_github_alerts: Assign alerts to the bot user to prevent conflicts.
     unclaim_github_alerts: Release alerts back to the pool for retry.
     close_github_alerts: Mark alerts as dismissed after successful remediation.
+    close_and_unclaim_github_alerts: Close and release alerts in one burst.
+    find_session_pull_request: Find the pull request opened by a Devin session.
+    refresh_github_credentials: Re-read tokens and the bot username after rotation.
 
 Environment Variables:
     GH_TOKEN: GitHub Personal Access Token with security_events write permission.
+    GH_TOKENS: Optional comma-separated extra tokens; alert updates rotate across
+               all tokens so each contributes its own rate-limit budget.
     DEVIN_BOT_USERNAME: Optional bot username for claiming (defaults to PAT owner).
 """
 
+import atexit
+import functools
+import logging
+import orjson
 import requests
 import os
+import threading
 import time
-from .DO_config import get_github_token
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from urllib3.util.retry import Retry
+from .DO_config import (
+    get_github_token,
+    get_github_tokens,
+    CLAIM_RETRY_ATTEMPTS,
+    CLAIM_RETRY_DELAY_SECONDS,
+    CLAIM_RETRY_JITTER_SECONDS,
+    CLAIM_MAX_WORKERS,
+    TOKEN_MIN_REMAINING,
+    RATE_LIMIT_MAX_WAIT_SECONDS,
+)
+from .DO_http import create_pooled_session
+
+log = logging.getLogger(__name__)
 
-CLAIM_RETRY_ATTEMPTS = 3
-CLAIM_RETRY_DELAY_SECONDS = 2
 GITHUB_API_BASE = "https://api.github.com"
 
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    """Return the Retry-After delay of a secondary rate-limit response, or None."""
+    if response.status_code not in (403, 429):
+        return None
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class _GitHubTokenPool:
+    """
+    Round-robin pool of GitHub tokens paced by GitHub's rate-limit headers.
+    
+    Every token has its own primary rate limit, so rotating requests across
+    the pool multiplies the available budget. A token whose remaining budget
+    drops below TOKEN_MIN_REMAINING is rested until its reported reset time,
+    and a token hit by a secondary rate limit is rested for its Retry-After
+    delay. Requests are only delayed when every token is resting.
+    """
+    
+    def __init__(self, tokens: list[str]):
+        self._tokens = tokens
+        self._next = 0
+        self._rested_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> str:
+        """
+        Return the next token that is not resting.
+        
+        If every token is resting, wait for the first one to recover, but at
+        most RATE_LIMIT_MAX_WAIT_SECONDS; past that the token is returned
+        anyway and the request fails fast instead of stalling the run.
+        """
+        with self._lock:
+            now = time.time()
+            for _ in range(len(self._tokens)):
+                token = self._tokens[self._next]
+                self._next = (self._next + 1) % len(self._tokens)
+                if self._rested_until.get(token, 0) <= now:
+                    return token
+            token = min(self._tokens, key=lambda t: self._rested_until.get(t, 0))
+            wait = self._rested_until.get(token, 0) - now
+        if wait <= RATE_LIMIT_MAX_WAIT_SECONDS:
+            log.warning("[RateLimit] All tokens are resting, waiting %.0fs", wait)
+            time.sleep(wait)
+        return token
+    
+    def record(self, token: str, response: requests.Response) -> None:
+        """Rest the token if the response shows it is rate limited or nearly spent."""
+        retry_after = _retry_after_seconds(response)
+        if retry_after is not None:
+            with self._lock:
+                self._rested_until[token] = time.time() + retry_after
+            log.warning("[RateLimit] Token #%s hit a secondary rate limit, resting for %.0fs", self._tokens.index(token) + 1, retry_after)
+            return
+        try:
+            remaining = int(response.headers["X-RateLimit-Remaining"])
+            reset_at = float(response.headers["X-RateLimit-Reset"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if remaining < TOKEN_MIN_REMAINING:
+            with self._lock:
+                self._rested_until[token] = reset_at
+            log.warning("[RateLimit] Token #%s has %s requests left, resting until reset", self._tokens.index(token) + 1, remaining)
+
+
+_token_pool: _GitHubTokenPool | None = None
+_token_pool_lock = threading.Lock()
+
+
+def _get_token_pool() -> _GitHubTokenPool:
+    """Build the shared token pool on first use."""
+    global _token_pool
+    with _token_pool_lock:
+        if _token_pool is None:
+            _token_pool = _GitHubTokenPool(get_github_tokens())
+        return _token_pool
+
+
+def refresh_github_credentials() -> None:
+    """
+    Drop every cached GitHub credential so the next request re-reads them.
+    
+    The token, the token pool and the bot username are resolved once and
+    cached; call this after rotating GH_TOKEN, GH_TOKENS or
+    DEVIN_BOT_USERNAME in the environment.
+    """
+    global _token_pool
+    get_github_token.cache_clear()
+    _get_authenticated_user.cache_clear()
+    _get_bot_username.cache_clear()
+    with _token_pool_lock:
+        _token_pool = None
+
+
+def _create_gh_session() -> requests.Session:
+    """
+    Create the pooled HTTP session shared by all alert updates.
+    
+    The static GitHub REST headers are set once on the session; only the
+    Authorization header varies per request because tokens rotate through
+    the pool. Keep-alive connections are reused across the PATCH bursts of
+    every batch thread.
+    
+    Transient failures (connection errors, 429 and 5xx) are retried by the
+    adapter with jittered exponential backoff, honouring Retry-After. The
+    jitter keeps the concurrent PATCHes of a burst that all hit the same
+    429 from retrying in lockstep. Alert PATCHes only set assignees or
+    state, so retrying them is idempotent.
+    
+    Returns:
+        A configured requests.Session
+    """
+    retry = Retry(
+        total=CLAIM_RETRY_ATTEMPTS - 1,
+        backoff_factor=CLAIM_RETRY_DELAY_SECONDS,
+        backoff_jitter=CLAIM_RETRY_JITTER_SECONDS,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "PATCH"),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "Content-Type": "application/json",
+        "X-GitHub-Api-Version": "2022-11-28"
+    }
+    return create_pooled_session(headers=headers, max_retries=retry)
+
+
+_gh_session = _create_gh_session()
+atexit.register(_gh_session.close)
+
+# Shared by every batch thread, so CLAIM_MAX_WORKERS caps alert PATCHes in
+# flight across the whole run rather than per call
+_alert_executor = ThreadPoolExecutor(max_workers=CLAIM_MAX_WORKERS, thread_name_prefix="alert-patch")
+atexit.register(_alert_executor.shutdown, wait=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _github_headers(token: str) -> dict[str, str]:
+    """Build the per-token GitHub Authorization header (cached per token in the pool)."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _send_alert_patch(url: str, body: bytes) -> requests.Response:
+    """
+    PATCH an alert using the next available pooled token.
+    
+    There is no fixed delay between requests; pacing comes from the token
+    pool, which reads GitHub's rate-limit headers. A request rejected with a
+    403 secondary rate limit is sent once more after its Retry-After delay;
+    429 responses are already retried by the session adapter.
+    
+    Args:
+        url: Alert API URL
+        body: Serialized JSON body of the update
+    
+    Returns:
+        The final response
+    
+    Raises:
+        requests.RequestException: If the request could not be sent
+    """
+    token_pool = _get_token_pool()
+    for _ in range(2):
+        token = token_pool.acquire()
+        response = _gh_session.patch(url, headers=_github_headers(token), data=body, timeout=30)
+        token_pool.record(token, response)
+        if response.status_code != 403 or _retry_after_seconds(response) is None:
+            break
+    return response
+
+
+@functools.lru_cache(maxsize=1)
 def _get_bot_username() -> str:
     """
     Get the bot username for claiming alerts.
     
     Returns the username from DEVIN_BOT_USERNAME environment variable if set,
-    otherwise falls back to the authenticated user (PAT owner).
+    otherwise falls back to the authenticated user (PAT owner). The result is
+    cached for the life of the process; call refresh_github_credentials()
+    after changing the environment or token.
     
     Returns:
         The bot username string
@@ -47,12 +250,16 @@ def _get_bot_username() -> str:
     # Fall back to the authenticated user (PAT owner)
     return _get_authenticated_user()
 
+@functools.lru_cache(maxsize=1)
 def _get_authenticated_user() -> str:
     """
     Get the username of the authenticated GitHub user (PAT owner).
     
     Makes a GET request to https://api.github.com/user to retrieve
-    the login (username) of the token owner.
+    the login (username) of the token owner. The PAT is fixed for the life of
+    the process, so the result is cached and only the first batch pays for the
+    round trip (failures are not cached). Use refresh_github_credentials()
+    after rotating GH_TOKEN.
     
     Returns:
         The username string of the authenticated user
@@ -60,16 +267,10 @@ def _get_authenticated_user() -> str:
     Raises:
         RuntimeError: If the API call fails or returns invalid data
     """
-    token = get_github_token()
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
-    response = requests.get("https://api.github.com/user", headers=headers)
+    response = _gh_session.get(f"{GITHUB_API_BASE}/user", headers=_github_headers(get_github_token()))
     if response.status_code != 200:
         raise RuntimeError(f"Failed to get authenticated user: HTTP {response.status_code}: {response.text[:100]}")
-    data = response.json()
+    data = orjson.loads(response.content)
     if "login" not in data:
         raise RuntimeError("Failed to get authenticated user: 'login' field not in response")
     return data["login"]
@@ -77,9 +278,7 @@ def _get_authenticated_user() -> str:
 def claim_github_alerts(
     owner: str,
     repo: str,
-    alert_numbers: list[int],
-    max_retries: int = CLAIM_RETRY_ATTEMPTS,
-    retry_delay: float = CLAIM_RETRY_DELAY_SECONDS
+    alert_numbers: list[int]
 ) -> dict[int, bool]:
     """
     Claim GitHub code scanning alerts by assigning them to the bot user.
@@ -88,72 +287,89 @@ def claim_github_alerts(
     might try to fix the same alerts simultaneously. Alerts are assigned
     to the bot user specified by DEVIN_BOT_USERNAME environment variable.
     
-    Uses retry logic with exponential backoff for transient failures.
+    Alerts are claimed concurrently (up to CLAIM_MAX_WORKERS at a time);
+    transient failures are retried by the session adapter.
     
     Args:
         owner: GitHub repository owner
         repo: GitHub repository name
         alert_numbers: List of alert numbers to claim
-        max_retries: Maximum number of retry attempts per alert (default: 3)
-        retry_delay: Base delay between retries in seconds (default: 2)
     
     Returns:
         Dictionary mapping alert_number to success status (True/False)
     """
-    token = get_github_token()
-    bot_username = _get_bot_username()
+    body = orjson.dumps({"assignees": [_get_bot_username()]})
     
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {token}",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
+    return _update_alerts_concurrently(
+        alert_numbers,
+        lambda alert_number: _patch_alert(owner, repo, alert_number, body, "[Claim]")
+    )
+
+def _update_alerts_concurrently(
+    alert_numbers: list[int],
+    update_one: Callable[[int], bool]
+) -> dict[int, bool]:
+    """
+    Apply a per-alert update to every alert on the shared alert executor.
     
-    results: dict[int, bool] = {}
+    Alert updates are independent PATCHes, so they are issued concurrently
+    instead of paying one round trip, plus retries, per alert in sequence.
+    The executor is module-level: its worker threads and their keep-alive
+    connections are reused across calls, and CLAIM_MAX_WORKERS bounds the
+    PATCHes in flight from all batches together. Duplicate alert numbers are
+    updated once.
     
-    for alert_number in alert_numbers:
-        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/code-scanning/alerts/{alert_number}"
-        
-        success = False
-        last_error = None
-        
-        for attempt in range(max_retries):
-            try:
-                payload = {
-                    "assignees": [bot_username]
-                }
-                
-                response = requests.patch(url, headers=headers, json=payload, timeout=30)
-                
-                if response.status_code == 200:
-                    success = True
-                    print(f"[Claim] Alert #{alert_number} claimed successfully by {bot_username}")
-                    break
-                else:
-                    last_error = f"HTTP {response.status_code}: {response.text[:100]}"
-                    print(f"[Claim] Attempt {attempt + 1}/{max_retries} failed for alert #{alert_number}: {last_error}")
-            
-            except requests.RequestException as e:
-                last_error = str(e)
-                print(f"[Claim] Attempt {attempt + 1}/{max_retries} error for alert #{alert_number}: {e}")
-            
-            if attempt < max_retries - 1:
-                delay = retry_delay * (2 ** attempt)
-                time.sleep(delay)
-        
-        results[alert_number] = success
-        if not success:
-            print(f"[Claim] Failed to claim alert #{alert_number} after {max_retries} attempts: {last_error}")
+    Args:
+        alert_numbers: Alert numbers to update
+        update_one: Function updating one alert and returning its success
+    
+    Returns:
+        Dictionary mapping alert_number to success status (True/False)
+    """
+    if not alert_numbers:
+        return {}
+    # An alert listed twice would cost a second identical PATCH
+    unique_numbers = list(dict.fromkeys(alert_numbers))
+    return dict(zip(unique_numbers, _alert_executor.map(update_one, unique_numbers)))
+
+def _patch_alert(owner: str, repo: str, alert_number: int, body: bytes, log_tag: str) -> bool:
+    """
+    Apply one update to a single alert.
+    
+    Shared by claiming, unclaiming and closing, which differ only in the
+    PATCH body. Callers serialize the body once per burst, since it is the
+    same for every alert. Retries happen in the session adapter and token
+    pool.
+    
+    Args:
+        owner: GitHub repository owner
+        repo: GitHub repository name
+        alert_number: Alert number to update
+        body: Serialized JSON body of the update
+        log_tag: Prefix for log messages, e.g. "[Claim]"
+    
+    Returns:
+        True if the alert was updated, False otherwise
+    """
+    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/code-scanning/alerts/{alert_number}"
+    
+    try:
+        response = _send_alert_patch(url, body)
         
-        time.sleep(0.5)
+        if response.status_code == 200:
+            log.info("%s Alert #%s updated successfully", log_tag, alert_number)
+            return True
+        log.error("%s Failed to update alert #%s: HTTP %s: %.100s", log_tag, alert_number, response.status_code, response.text)
     
-    return results
+    except requests.RequestException as e:
+        log.error("%s Error updating alert #%s: %s", log_tag, alert_number, e)
+    
+    return False
+
 def unclaim_github_alerts(
     owner: str,
     repo: str,
-    alert_numbers: list[int],
-    max_retries: int = CLAIM_RETRY_ATTEMPTS,
-    retry_delay: float = CLAIM_RETRY_DELAY_SECONDS
+    alert_numbers: list[int]
 ) -> dict[int, bool]:
     """
     Unclaim GitHub code scanning alerts by removing all assignees.
@@ -161,65 +377,23 @@ def unclaim_github_alerts(
     This releases alerts back to the pool so they can be picked up by
     future orchestrator runs. Used when remediation fails or is partial.
     
-    Uses retry logic with exponential backoff for transient failures.
+    Alerts are unclaimed concurrently (up to CLAIM_MAX_WORKERS at a time);
+    transient failures are retried by the session adapter.
     
     Args:
         owner: GitHub repository owner
         repo: GitHub repository name
         alert_numbers: List of alert numbers to unclaim
-        max_retries: Maximum number of retry attempts per alert (default: 3)
-        retry_delay: Base delay between retries in seconds (default: 2)
     
     Returns:
         Dictionary mapping alert_number to success status (True/False)
     """
-    token = get_github_token()
-    
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {token}",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
+    body = orjson.dumps({"assignees": []})
     
-    results: dict[int, bool] = {}
-    
-    for alert_number in alert_numbers:
-        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/code-scanning/alerts/{alert_number}"
-        
-        success = False
-        last_error = None
-        
-        for attempt in range(max_retries):
-            try:
-                payload = {
-                    "assignees": []
-                }
-                
-                response = requests.patch(url, headers=headers, json=payload, timeout=30)
-                
-                if response.status_code == 200:
-                    success = True
-                    print(f"[Unclaim] Alert #{alert_number} unclaimed successfully")
-                    break
-                else:
-                    last_error = f"HTTP {response.status_code}: {response.text[:100]}"
-                    print(f"[Unclaim] Attempt {attempt + 1}/{max_retries} failed for alert #{alert_number}: {last_error}")
-            
-            except requests.RequestException as e:
-                last_error = str(e)
-                print(f"[Unclaim] Attempt {attempt + 1}/{max_retries} error for alert #{alert_number}: {e}")
-            
-            if attempt < max_retries - 1:
-                delay = retry_delay * (2 ** attempt)
-                time.sleep(delay)
-        
-        results[alert_number] = success
-        if not success:
-            print(f"[Unclaim] Failed to unclaim alert #{alert_number} after {max_retries} attempts: {last_error}")
-        
-        time.sleep(0.5)
-    
-    return results
+    return _update_alerts_concurrently(
+        alert_numbers,
+        lambda alert_number: _patch_alert(owner, repo, alert_number, body, "[Unclaim]")
+    )
 
 def close_github_alerts(
     owner: str,
@@ -230,6 +404,8 @@ def close_github_alerts(
     """
     Close GitHub code scanning alerts after successful remediation.
     
+    Alerts are closed concurrently (up to CLAIM_MAX_WORKERS at a time).
+    
     Args:
         owner: GitHub repository owner
         repo: GitHub repository name
@@ -239,38 +415,86 @@ def close_github_alerts(
     Returns:
         Dictionary mapping alert_number to success status (True/False)
     """
-    token = get_github_token()
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {token}",
-        "X-GitHub-Api-Version": "2022-11-28"
-    }
+    body = orjson.dumps({"state": "dismissed", "dismissed_reason": reason})
+    
+    return _update_alerts_concurrently(
+        alert_numbers,
+        lambda alert_number: _patch_alert(owner, repo, alert_number, body, "[Close]")
+    )
+
+def close_and_unclaim_github_alerts(
+    owner: str,
+    repo: str,
+    close_numbers: list[int],
+    unclaim_numbers: list[int],
+    reason: str = "used in tests"
+) -> tuple[dict[int, bool], dict[int, bool]]:
+    """
+    Close some alerts and unclaim others in one concurrent burst.
     
-    results: dict[int, bool] = {}
+    Used for partially successful sessions. All updates share one bounded
+    executor, so both groups complete in about one round trip instead of
+    one burst after the other.
     
-    for alert_number in alert_numbers:
-        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/code-scanning/alerts/{alert_number}"
-        
-        try:
-            payload = {
-                "state": "dismissed",
-                "dismissed_reason": reason
-            }
-            
-            response = requests.patch(url, headers=headers, json=payload, timeout=30)
-            
-            if response.status_code == 200:
-                results[alert_number] = True
-                print(f"[Close] Alert #{alert_number} closed successfully")
-            else:
-                results[alert_number] = False
-                print(f"[Close] Failed to close alert #{alert_number}: {response.status_code}")
-        
-        except requests.RequestException as e:
-            results[alert_number] = False
-            print(f"[Close] Error closing alert #{alert_number}: {e}")
-        
-        time.sleep(0.5)
+    Args:
+        owner: GitHub repository owner
+        repo: GitHub repository name
+        close_numbers: Alert numbers to dismiss
+        unclaim_numbers: Alert numbers to release
+        reason: Dismissal reason for the closed alerts
     
-    return results
+    Returns:
+        Tuple of (close results, unclaim results), each mapping alert_number
+        to success status (True/False)
+    """
+    close_set = set(close_numbers)
+    close_body = orjson.dumps({"state": "dismissed", "dismissed_reason": reason})
+    unclaim_body = orjson.dumps({"assignees": []})
+    
+    def update_one(alert_number: int) -> bool:
+        if alert_number in close_set:
+            return _patch_alert(owner, repo, alert_number, close_body, "[Close]")
+        return _patch_alert(owner, repo, alert_number, unclaim_body, "[Unclaim]")
+    
+    results = _update_alerts_concurrently([*close_numbers, *unclaim_numbers], update_one)
+    return (
+        {num: results[num] for num in close_numbers},
+        {num: results[num] for num in unclaim_numbers}
+    )
 
+def find_session_pull_request(owner: str, repo: str, session_id: str) -> str | None:
+    """
+    Look for an open pull request opened by a Devin session.
+    
+    Devin links its session in the body of every pull request it opens, so
+    the most recently created open pull requests are searched for the session
+    ID. This lets the poller notice a new PR on GitHub's side without waiting
+    for the Devin API to report it.
+    
+    Args:
+        owner: GitHub repository owner
+        repo: GitHub repository name
+        session_id: Devin session ID (with or without the "devin-" prefix)
+    
+    Returns:
+        The pull request URL, or None if none was found or the lookup failed
+    """
+    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls"
+    params = {"state": "open", "sort": "created", "direction": "desc", "per_page": 20}
+    marker = session_id.removeprefix("devin-")
+    token_pool = _get_token_pool()
+    
+    try:
+        token = token_pool.acquire()
+        response = _gh_session.get(url, headers=_github_headers(token), params=params, timeout=30)
+        token_pool.record(token, response)
+        if response.status_code != 200:
+            return None
+        for pull_request in orjson.loads(response.content):
+            if marker in (pull_request.get("body") or ""):
+                return pull_request.get("html_url")
+    
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        log.warning("[PR] Error looking up pull request for session %s: %s", session_id, e)
+    
+    return None
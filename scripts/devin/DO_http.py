@@ -0,0 +1,105 @@
+"""Shared HTTP transport helpers for the Devin and GitHub alert sessions."""
+
+import functools
+import re
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .DO_config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, KEEPALIVE_IDLE_TTL_SECONDS, get_devin_api_key
+
+# Matches the timeout parameter of a "Keep-Alive: timeout=5, max=1000" header
+_KEEPALIVE_TIMEOUT_RE = re.compile(r"timeout\s*=\s*(\d+)", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1)
+def devin_authorization() -> str:
+    """
+    Build the Devin Authorization header value once (on the first request).
+    
+    Shared by every Devin session (DO_session and termination_logic), so a
+    single cache_clear() after rotating DEVIN_API_KEY covers all of them.
+    """
+    return f"Bearer {get_devin_api_key()}"
+
+
+class DevinAuth(requests.auth.AuthBase):
+    """Attach the cached Devin Authorization header to every request of a session."""
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        request.headers["Authorization"] = devin_authorization()
+        return request
+
+
+class KeepAliveTTLAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that drops pooled connections before the server closes them.
+
+    Servers silently close idle keep-alive connections (GitHub after about
+    60 seconds), so a request sent after a long poll wait would otherwise
+    pick a dead socket and fail or retry. The adapter remembers when it last
+    sent a request and, if the pool has been idle longer than the TTL, closes
+    it so the next request opens a fresh connection. The TTL starts at
+    KEEPALIVE_IDLE_TTL_SECONDS and is lowered to just under any timeout the
+    server advertises in a Keep-Alive response header.
+    """
+
+    def __init__(self, *args, idle_ttl: float = KEEPALIVE_IDLE_TTL_SECONDS, **kwargs):
+        self.idle_ttl = idle_ttl
+        self._last_used = time.monotonic()
+        self._ttl_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:
+        with self._ttl_lock:
+            now = time.monotonic()
+            if now - self._last_used > self.idle_ttl:
+                self.poolmanager.clear()
+            self._last_used = now
+        return super().send(request, *args, **kwargs)
+
+    def build_response(self, req, resp) -> requests.Response:
+        response = super().build_response(req, resp)
+        keep_alive = response.headers.get("Keep-Alive")
+        if keep_alive:
+            match = _KEEPALIVE_TIMEOUT_RE.search(keep_alive)
+            if match:
+                server_ttl = max(int(match.group(1)) - 1, 1)
+                with self._ttl_lock:
+                    self.idle_ttl = min(self.idle_ttl, server_ttl)
+        with self._ttl_lock:
+            self._last_used = time.monotonic()
+        return response
+
+
+def create_pooled_session(
+    headers: dict[str, str] | None = None,
+    auth: requests.auth.AuthBase | None = None,
+    max_retries: Retry | int = 0
+) -> requests.Session:
+    """
+    Create a keep-alive requests.Session for one API.
+    
+    HTTPS requests go through a KeepAliveTTLAdapter sized by
+    HTTP_POOL_CONNECTIONS and HTTP_POOL_MAXSIZE, so every worker thread can
+    hold a connection without blocking and idle sockets are dropped before
+    the server closes them.
+    
+    Args:
+        headers: Static headers sent with every request
+        auth: Optional auth hook attaching credentials at send time
+        max_retries: Retry policy for the adapter (default: no retries)
+    
+    Returns:
+        A configured requests.Session
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    session.auth = auth
+    adapter = KeepAliveTTLAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=max_retries)
+    session.mount("https://", adapter)
+    return session
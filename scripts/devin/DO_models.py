@@ -7,13 +7,12 @@ Sentinel system for tracking session states, results, and orchestrator state.
 Classes:
     SessionStatus: Enum representing possible states of a Devin session.
     SessionResult: Dataclass containing the outcome of a remediation session.
-    OrchestratorState: Thread-safe container for tracking all active sessions.
+    OrchestratorState: Lock-free container for tracking all active sessions.
 """
 
 from typing import Any
 from dataclasses import dataclass, field
 from enum import Enum
-import threading
 
 
 class SessionStatus(Enum):
@@ -41,7 +40,7 @@ class SessionStatus(Enum):
     RUNNING = "running"
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionResult:
     """
     Result of a completed Devin remediation session.
@@ -59,6 +58,8 @@ class SessionResult:
         error_message: Description of any error that occurred.
         fixed_alerts: List of alert numbers that were successfully fixed.
         unfixed_alerts: List of alert numbers that remain unfixed.
+    
+    Uses __slots__, so instances carry no per-instance __dict__.
     """
     status: SessionStatus
     session_id: str
@@ -71,25 +72,25 @@ class SessionResult:
     unfixed_alerts: list[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrchestratorState:
     """
     Thread-safe state container for the orchestrator.
     
     This class maintains the mapping between sessions, batches, and alerts,
     allowing the orchestrator to track progress across multiple concurrent
-    worker threads. All operations are protected by a threading lock.
+    worker threads. No lock is needed: every method is a single dict
+    assignment, dict read or list append, each of which is atomic in CPython,
+    and each session ID is registered by exactly one worker.
     
     Attributes:
         session_to_alerts: Maps session IDs to their assigned alert numbers.
         session_to_batch: Maps session IDs to their batch identifiers.
         results: List of completed SessionResult objects.
-        lock: Threading lock for thread-safe operations.
     """
     session_to_alerts: dict[str, list[int]] = field(default_factory=dict)
     session_to_batch: dict[str, str] = field(default_factory=dict)
     results: list[SessionResult] = field(default_factory=list)
-    lock: threading.Lock = field(default_factory=threading.Lock)
 
     def register_session(self, session_id: str, batch_id: str, alert_numbers: list[int]) -> None:
         """
@@ -100,9 +101,10 @@ class OrchestratorState:
             batch_id: Identifier for the vulnerability batch.
             alert_numbers: List of GitHub alert numbers assigned to this session.
         """
-        with self.lock:
-            self.session_to_alerts[session_id] = alert_numbers
-            self.session_to_batch[session_id] = batch_id
+        # The batch is stored first, so a reader that finds the session's
+        # alerts can also find its batch.
+        self.session_to_batch[session_id] = batch_id
+        self.session_to_alerts[session_id] = alert_numbers
 
     def add_result(self, result: SessionResult) -> None:
         """
@@ -111,8 +113,8 @@ class OrchestratorState:
         Args:
             result: SessionResult object containing the session outcome.
         """
-        with self.lock:
-            self.results.append(result)
+        # list.append is atomic, so concurrent workers need no lock here
+        self.results.append(result)
 
     def get_alerts_for_session(self, session_id: str) -> list[int]:
         """
@@ -124,5 +126,6 @@ class OrchestratorState:
         Returns:
             List of alert numbers, or empty list if session not found.
         """
-        with self.lock:
-            return self.session_to_alerts.get(session_id, [])
+        # A single dict.get is atomic and each entry is stored with one
+        # assignment, so a lock-free read never sees a partial entry.
+        return self.session_to_alerts.get(session_id, [])
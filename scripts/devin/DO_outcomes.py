@@ -12,13 +12,35 @@ Outcome Handling:
     STUCK/TIMEOUT: Unclaim all alerts for retry.
 """
 
+import logging
+
 from .DO_models import SessionStatus, SessionResult
 from .DO_gh_alerts_control_center import (
     claim_github_alerts,
     unclaim_github_alerts,
     close_github_alerts,
+    close_and_unclaim_github_alerts,
 )
 
+log = logging.getLogger(__name__)
+
+
+def _partition_results(results: dict[int, bool]) -> tuple[list[int], list[int]]:
+    """
+    Split per-alert update results into succeeded and failed alert numbers.
+    
+    Args:
+        results: Dictionary mapping alert_number to success status
+    
+    Returns:
+        Tuple of (succeeded alert numbers, failed alert numbers)
+    """
+    succeeded: list[int] = []
+    failed: list[int] = []
+    for num, success in results.items():
+        (succeeded if success else failed).append(num)
+    return succeeded, failed
+
 
 def handle_session_outcome(
     result: SessionResult,
@@ -45,59 +67,61 @@ def handle_session_outcome(
     alert_numbers = result.alert_numbers
     
     if not alert_numbers:
-        print(f"[Outcome] No alerts associated with session {result.session_id}")
+        log.info("[Outcome] No alerts associated with session %s", result.session_id)
         return result
     
-    print(f"[Outcome] Processing outcome for session {result.session_id}: {result.status.value}")
+    log.info("[Outcome] Processing outcome for session %s: %s", result.session_id, result.status.value)
     
-    if result.status == SessionStatus.SUCCESS:
-        print(f"[Outcome] Session succeeded, closing {len(alert_numbers)} alerts")
+    status = result.status
+    
+    if status is SessionStatus.SUCCESS:
+        log.info("[Outcome] Session succeeded, closing %s alerts", len(alert_numbers))
         close_results = close_github_alerts(owner, repo, alert_numbers, reason="used in tests")
         
-        result.fixed_alerts = [num for num, success in close_results.items() if success]
-        result.unfixed_alerts = [num for num, success in close_results.items() if not success]
+        result.fixed_alerts, result.unfixed_alerts = _partition_results(close_results)
         
         if result.unfixed_alerts:
-            print(f"[Outcome] Warning: Failed to close alerts: {result.unfixed_alerts}")
+            log.warning("[Outcome] Failed to close alerts: %s", result.unfixed_alerts)
     
-    elif result.status == SessionStatus.FAILURE:
-        print(f"[Outcome] Session failed, unclaiming {len(alert_numbers)} alerts for retry")
+    elif status is SessionStatus.FAILURE:
+        log.info("[Outcome] Session failed, unclaiming %s alerts for retry", len(alert_numbers))
         unclaim_results = unclaim_github_alerts(owner, repo, alert_numbers)
         
-        unclaimed = [num for num, success in unclaim_results.items() if success]
-        failed_unclaims = [num for num, success in unclaim_results.items() if not success]
+        _, failed_unclaims = _partition_results(unclaim_results)
         
         if failed_unclaims:
-            print(f"[Outcome] Warning: Failed to unclaim alerts: {failed_unclaims}")
+            log.warning("[Outcome] Failed to unclaim alerts: %s", failed_unclaims)
         
-        result.unfixed_alerts = alert_numbers
+        result.unfixed_alerts = list(alert_numbers)
     
-    elif result.status == SessionStatus.PARTIAL:
+    elif status is SessionStatus.PARTIAL:
         fixed = result.fixed_alerts or []
-        unfixed = [n for n in alert_numbers if n not in fixed]
+        # Set lookups keep this linear; a comprehension rather than a set
+        # difference keeps unfixed alerts in batch order for the summary.
+        fixed_set = set(fixed)
+        unfixed = [n for n in alert_numbers if n not in fixed_set]
         
         if fixed:
-            print(f"[Outcome] Closing {len(fixed)} fixed alerts")
-            close_github_alerts(owner, repo, fixed, reason="used in tests")
+            log.info("[Outcome] Closing %s fixed alerts", len(fixed))
+        if unfixed:
+            log.info("[Outcome] Unclaiming %s unfixed alerts for retry", len(unfixed))
+        _, unclaim_results = close_and_unclaim_github_alerts(owner, repo, fixed, unfixed, reason="used in tests")
         
         if unfixed:
-            print(f"[Outcome] Unclaiming {len(unfixed)} unfixed alerts for retry")
-            unclaim_results = unclaim_github_alerts(owner, repo, unfixed)
-            
-            failed_unclaims = [num for num, success in unclaim_results.items() if not success]
+            _, failed_unclaims = _partition_results(unclaim_results)
             if failed_unclaims:
-                print(f"[Outcome] Warning: Failed to unclaim alerts: {failed_unclaims}")
+                log.warning("[Outcome] Failed to unclaim alerts: %s", failed_unclaims)
             
             result.unfixed_alerts = unfixed
     
-    elif result.status in (SessionStatus.STUCK, SessionStatus.TIMEOUT):
-        print(f"[Outcome] Session {result.status.value}, unclaiming {len(alert_numbers)} alerts for retry")
+    elif status is SessionStatus.STUCK or status is SessionStatus.TIMEOUT:
+        log.info("[Outcome] Session %s, unclaiming %s alerts for retry", status.value, len(alert_numbers))
         unclaim_results = unclaim_github_alerts(owner, repo, alert_numbers)
         
-        failed_unclaims = [num for num, success in unclaim_results.items() if not success]
+        _, failed_unclaims = _partition_results(unclaim_results)
         if failed_unclaims:
-            print(f"[Outcome] Warning: Failed to unclaim alerts: {failed_unclaims}")
+            log.warning("[Outcome] Failed to unclaim alerts: %s", failed_unclaims)
         
-        result.unfixed_alerts = alert_numbers
+        result.unfixed_alerts = list(alert_numbers)
     
     return result
@@ -9,8 +9,58 @@ The XML format is designed for efficient parsing by LLMs while maintaining
 human readability for debugging and review purposes.
 """
 
+import functools
+import string
+from html import escape
 from typing import Any
 
+# Number of distinct rendered prompts kept in memory
+PROMPT_CACHE_SIZE = 256
+
+# XML block rendered once per vulnerability in the batch
+_VULNERABILITY_TEMPLATE = """
+    <vulnerability>
+      <rule>{rule}</rule>
+      <file>{file}</file>
+      <line>{line}</line>
+      <source>{source}</source>
+      <alert_number>{alert_number}</alert_number>
+    </vulnerability>"""
+
+# Full prompt document; the vulnerability blocks are joined into ${vulnerabilities_xml}
+_PROMPT_TEMPLATE = string.Template("""<security_remediation_task>
+  <metadata>
+    <batch_id>${batch_id}</batch_id>
+    <repository>${owner}/${repo}</repository>
+    <task_type>vulnerability_remediation</task_type>
+  </metadata>
+
+  <description>
+    ${task_description}
+  </description>
+
+  <vulnerabilities>${vulnerabilities_xml}
+  </vulnerabilities>
+
+  <instructions>
+    <step>1. Clone the repository ${owner}/${repo} if not already available</step>
+    <step>2. Analyze each vulnerability location listed above</step>
+    <step>3. Implement secure fixes for all vulnerabilities in this batch</step>
+    <step>4. Ensure fixes follow security best practices (input validation, parameterized queries, etc.)</step>
+    <step>5. Run all existing tests to verify fixes don't break functionality</step>
+    <step>6. Create a new branch named 'security-fix/${batch_id}'</step>
+    <step>7. Commit all changes with descriptive commit messages</step>
+    <step>8. Open a GitHub Pull Request with title: 'Security Fix: ${batch_id}'</step>
+    <step>9. Include a summary of all fixes in the PR description</step>
+  </instructions>
+
+  <requirements>
+    <requirement>All vulnerabilities in this batch must be addressed</requirement>
+    <requirement>Tests must pass after fixes are applied</requirement>
+    <requirement>PR must be created and ready for review</requirement>
+  </requirements>
+</security_remediation_task>""")
+
 
 def create_devin_prompt(
     task_description: str,
@@ -38,51 +88,62 @@ def create_devin_prompt(
     Returns:
         XML-formatted prompt string optimized for Devin AI processing
     """
-    tasks = batch_data.get("tasks", [])
-    severity = batch_data.get("severity", 0)
-    
-    vulnerabilities_xml = ""
-    for task in tasks:
-        vulnerabilities_xml += f"""
-    <vulnerability>
-      <rule>{batch_id}</rule>
-      <file>{task.get('file', 'unknown')}</file>
-      <line>{task.get('line', 'unknown')}</line>
-      <source>{task.get('source', 'N/A')}</source>
-      <alert_number>{task.get('alert_number', 'N/A')}</alert_number>
-    </vulnerability>"""
-
-    prompt = f"""<security_remediation_task>
-  <metadata>
-    <batch_id>{batch_id}</batch_id>
-    <repository>{owner}/{repo}</repository>
-    <task_type>vulnerability_remediation</task_type>
-  </metadata>
+    task_fields = tuple(
+        (
+            _xml_text(task.get('file', 'unknown')),
+            _xml_text(task.get('line', 'unknown')),
+            _xml_text(task.get('source', 'N/A')),
+            _xml_text(task.get('alert_number', 'N/A')),
+        )
+        for task in batch_data.get("tasks", [])
+    )
+    return _render_prompt(
+        _xml_text(task_description), task_fields, _xml_text(batch_id), _xml_text(owner), _xml_text(repo)
+    )
 
-  <description>
-    {task_description}
-  </description>
 
-  <vulnerabilities>{vulnerabilities_xml}
-  </vulnerabilities>
+def _xml_text(value: Any) -> str:
+    """Escape a value for use as XML element text (&, < and >)."""
+    # Line and alert numbers are ints, whose text never needs escaping
+    if type(value) is int:
+        return str(value)
+    return escape(str(value), quote=False)
 
-  <instructions>
-    <step>1. Clone the repository {owner}/{repo} if not already available</step>
-    <step>2. Analyze each vulnerability location listed above</step>
-    <step>3. Implement secure fixes for all vulnerabilities in this batch</step>
-    <step>4. Ensure fixes follow security best practices (input validation, parameterized queries, etc.)</step>
-    <step>5. Run all existing tests to verify fixes don't break functionality</step>
-    <step>6. Create a new branch named 'security-fix/{batch_id}'</step>
-    <step>7. Commit all changes with descriptive commit messages</step>
-    <step>8. Open a GitHub Pull Request with title: 'Security Fix: {batch_id}'</step>
-    <step>9. Include a summary of all fixes in the PR description</step>
-  </instructions>
 
-  <requirements>
-    <requirement>All vulnerabilities in this batch must be addressed</requirement>
-    <requirement>Tests must pass after fixes are applied</requirement>
-    <requirement>PR must be created and ready for review</requirement>
-  </requirements>
-</security_remediation_task>"""
+@functools.lru_cache(maxsize=PROMPT_CACHE_SIZE)
+def _render_prompt(
+    task_description: str,
+    task_fields: tuple[tuple[Any, Any, Any, Any], ...],
+    batch_id: str,
+    owner: str,
+    repo: str
+) -> str:
+    """
+    Render the prompt XML from hashable inputs, memoizing the result.
+    
+    All inputs must already be XML-escaped.
+    
+    Args:
+        task_description: Human-readable description of the vulnerability batch
+        task_fields: One (file, line, source, alert_number) tuple per task
+        batch_id: Identifier for the vulnerability batch
+        owner: GitHub repository owner
+        repo: GitHub repository name
+    
+    Returns:
+        XML-formatted prompt string
+    """
+    # join() builds a list from its argument anyway, so pass it one directly
+    render = _VULNERABILITY_TEMPLATE.format
+    vulnerabilities_xml = "".join([
+        render(rule=batch_id, file=file, line=line, source=source, alert_number=alert_number)
+        for file, line, source, alert_number in task_fields
+    ])
 
-    return prompt
+    return _PROMPT_TEMPLATE.substitute(
+        batch_id=batch_id,
+        owner=owner,
+        repo=repo,
+        task_description=task_description,
+        vulnerabilities_xml=vulnerabilities_xml
+    )
@@ -6,8 +6,22 @@ orchestrator runs. It displays batch statistics, alert statistics, and
 detailed results for each processed batch.
 """
 
+import logging
+from collections import Counter
+
 from .DO_models import SessionStatus, SessionResult
 
+log = logging.getLogger(__name__)
+
+# Label shown before each batch in the detailed results
+_STATUS_ICONS = {
+    SessionStatus.SUCCESS: "[OK]",
+    SessionStatus.FAILURE: "[FAIL]",
+    SessionStatus.PARTIAL: "[PARTIAL]",
+    SessionStatus.STUCK: "[STUCK]",
+    SessionStatus.TIMEOUT: "[TIMEOUT]"
+}
+
 
 def print_summary(results: list[SessionResult]) -> None:
     """
@@ -15,59 +29,64 @@ def print_summary(results: list[SessionResult]) -> None:
     
     Displays comprehensive statistics including batch counts by status,
     alert counts (total, fixed, unfixed), and detailed per-batch results
-    with session URLs and PR links where available.
+    with session URLs and PR links where available. The report is built in
+    memory and logged as a single record, so it goes through the same queue
+    as every earlier log line and is printed after them.
     
     Args:
         results: List of SessionResult objects from the completed run.
     """
     total = len(results)
-    successes = sum(1 for r in results if r.status == SessionStatus.SUCCESS)
-    failures = sum(1 for r in results if r.status == SessionStatus.FAILURE)
-    partials = sum(1 for r in results if r.status == SessionStatus.PARTIAL)
-    stuck = sum(1 for r in results if r.status == SessionStatus.STUCK)
-    timeouts = sum(1 for r in results if r.status == SessionStatus.TIMEOUT)
+    status_counts: Counter[SessionStatus] = Counter()
+    total_alerts = fixed_alerts = unfixed_alerts = 0
+    for r in results:
+        status_counts[r.status] += 1
+        total_alerts += len(r.alert_numbers)
+        fixed_alerts += len(r.fixed_alerts)
+        unfixed_alerts += len(r.unfixed_alerts)
     
-    total_alerts = sum(len(r.alert_numbers) for r in results)
-    fixed_alerts = sum(len(r.fixed_alerts) for r in results)
-    unfixed_alerts = sum(len(r.unfixed_alerts) for r in results)
+    successes = status_counts[SessionStatus.SUCCESS]
+    failures = status_counts[SessionStatus.FAILURE]
+    partials = status_counts[SessionStatus.PARTIAL]
+    stuck = status_counts[SessionStatus.STUCK]
+    timeouts = status_counts[SessionStatus.TIMEOUT]
     
-    print("\n" + "=" * 60)
-    print("           SENTINEL RUN SUMMARY")
-    print("=" * 60)
-    print(f"\nBatch Statistics:")
-    print(f"  Total Batches:     {total}")
-    print(f"  Successes:         {successes}")
-    print(f"  Partial Successes: {partials}")
-    print(f"  Failures:          {failures}")
-    print(f"  Stuck Sessions:    {stuck}")
-    print(f"  Timeouts:          {timeouts}")
+    lines: list[str] = []
+    add = lines.append
     
-    print(f"\nAlert Statistics:")
-    print(f"  Total Alerts:      {total_alerts}")
-    print(f"  Fixed Alerts:      {fixed_alerts}")
-    print(f"  Unfixed Alerts:    {unfixed_alerts}")
+    add("=" * 60)
+    add("           SENTINEL RUN SUMMARY")
+    add("=" * 60)
+    add(f"\nBatch Statistics:")
+    add(f"  Total Batches:     {total}")
+    add(f"  Successes:         {successes}")
+    add(f"  Partial Successes: {partials}")
+    add(f"  Failures:          {failures}")
+    add(f"  Stuck Sessions:    {stuck}")
+    add(f"  Timeouts:          {timeouts}")
+    
+    add(f"\nAlert Statistics:")
+    add(f"  Total Alerts:      {total_alerts}")
+    add(f"  Fixed Alerts:      {fixed_alerts}")
+    add(f"  Unfixed Alerts:    {unfixed_alerts}")
     
     if results:
-        print(f"\nDetailed Results:")
+        add(f"\nDetailed Results:")
         for r in results:
-            status_icon = {
-                SessionStatus.SUCCESS: "[OK]",
-                SessionStatus.FAILURE: "[FAIL]",
-                SessionStatus.PARTIAL: "[PARTIAL]",
-                SessionStatus.STUCK: "[STUCK]",
-                SessionStatus.TIMEOUT: "[TIMEOUT]"
-            }.get(r.status, "[?]")
+            status_icon = _STATUS_ICONS.get(r.status, "[?]")
             
-            print(f"  {status_icon} {r.batch_id}")
+            add(f"  {status_icon} {r.batch_id}")
             if r.session_id:
-                print(f"       Session: {r.session_id}")
+                add(f"       Session: {r.session_id}")
             if r.pr_url:
-                print(f"       PR: {r.pr_url}")
+                add(f"       PR: {r.pr_url}")
             if r.error_message:
-                print(f"       Error: {r.error_message[:80]}...")
+                add(f"       Error: {r.error_message[:80]}...")
             if r.fixed_alerts:
-                print(f"       Fixed: {r.fixed_alerts}")
+                add(f"       Fixed: {r.fixed_alerts}")
             if r.unfixed_alerts:
-                print(f"       Unfixed: {r.unfixed_alerts}")
+                add(f"       Unfixed: {r.unfixed_alerts}")
+    
+    add("\n" + "=" * 60)
     
-    print("\n" + "=" * 60)
+    log.info("\n".join(lines))
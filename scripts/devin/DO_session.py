@@ -1,20 +1,192 @@
 """Devin AI session management - creation, status polling, and monitoring."""
 
+import atexit
+import hashlib
+import logging
+import os
+import random
+import tempfile
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import orjson
 import requests
+from urllib3.util.retry import Retry
 
 from .DO_config import (
     DEVIN_API_BASE,
+    DEVIN_RETRY_ATTEMPTS,
+    DEVIN_RETRY_BACKOFF_SECONDS,
     POLL_INTERVAL_SECONDS,
+    POLL_INITIAL_INTERVAL_SECONDS,
+    POLL_JITTER_SECONDS,
+    POLL_RETRY_BACKOFF_FACTOR,
+    POLL_HISTORY_FILENAME,
+    POLL_HISTORY_MIN_SAMPLES,
+    POLL_HISTORY_MAX_SAMPLES,
+    PR_LOOKUP_TIMEOUT_SECONDS,
     SESSION_TIMEOUT_SECONDS,
+    SESSION_LIST_CACHE_TTL_SECONDS,
     STAGNATION_THRESHOLD_SECONDS,
     get_devin_api_key,
     MAX_ACTIVE_SESSIONS,
 )
+from .DO_gh_alerts_control_center import find_session_pull_request, refresh_github_credentials
+from .DO_http import DevinAuth, create_pooled_session, devin_authorization
 from .DO_models import SessionStatus, SessionResult
 
+log = logging.getLogger(__name__)
+
+
+def refresh_credentials() -> None:
+    """
+    Drop every cached Devin and GitHub credential.
+    
+    API keys, tokens and the prebuilt Authorization headers are cached on
+    first use, so clearing only one of them (e.g. get_devin_api_key) would
+    leave a stale header behind. The Devin header is shared with
+    termination_logic (see DO_http.devin_authorization), so sleep messages,
+    capacity checks and cleanup pick up the new key as well. Call this after
+    rotating DEVIN_API_KEY, GH_TOKEN or GH_TOKENS in the environment of a
+    long-lived process.
+    """
+    get_devin_api_key.cache_clear()
+    devin_authorization.cache_clear()
+    refresh_github_credentials()
+
+
+def _create_devin_session() -> requests.Session:
+    """
+    Create the pooled HTTP session shared by all Devin API calls.
+    
+    Keep-alive connections are reused across session creation and the
+    repeated status polls of every worker thread, so only the first request
+    to the API pays for the TCP and TLS handshake. Connections left idle
+    through a long poll wait are dropped before reuse (see DO_http).
+    
+    Rate-limit (429) and 5xx responses and connection errors are retried by
+    the adapter with jittered exponential backoff, waiting for Retry-After
+    when the API sends it. POST is retried too: the only POST sent on this
+    session is create_devin_session(), which always includes an idempotency
+    key, so a retry after the server accepted the request returns the
+    existing session instead of creating a duplicate.
+    
+    The API key is read lazily by the session's auth hook, so importing this
+    module does not require DEVIN_API_KEY and call sites pass no headers.
+    
+    Returns:
+        A configured requests.Session
+    """
+    retry = Retry(
+        total=DEVIN_RETRY_ATTEMPTS,
+        backoff_factor=DEVIN_RETRY_BACKOFF_SECONDS,
+        backoff_jitter=POLL_JITTER_SECONDS,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "POST"),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    return create_pooled_session(headers={"Content-Type": "application/json"}, auth=DevinAuth(), max_retries=retry)
+
+
+_devin_session = _create_devin_session()
+atexit.register(_devin_session.close)
+
+
+# Devin statuses that end polling, mapped to (final status, fixed error message).
+# A None message means the session's own status message is reported instead.
+_TERMINAL_STATUSES: dict[str, tuple[SessionStatus, str | None]] = {
+    "finished": (SessionStatus.SUCCESS, None),
+    "completed": (SessionStatus.SUCCESS, None),
+    "success": (SessionStatus.SUCCESS, None),
+    "failed": (SessionStatus.FAILURE, None),
+    "error": (SessionStatus.FAILURE, None),
+    "cancelled": (SessionStatus.FAILURE, None),
+    "blocked": (SessionStatus.FAILURE, "Session is blocked and requires manual intervention"),
+}
+
+# Terminal statuses whose result GitHub is searched for an unreported PR.
+# Both end polling, so each session is looked up at most once.
+_PR_LOOKUP_STATUSES = frozenset({"finished", "blocked"})
+
+# Set to wake every sleeping poller at once, e.g. when the run is aborted
+_polling_cancelled = threading.Event()
+
+# Maps session ID -> event that wakes its poller early when news arrives
+_session_wakeups: dict[str, threading.Event] = {}
+
+# Runs the GitHub pull request lookups of finished or blocked sessions that report no PR
+_pr_lookup_executor = ThreadPoolExecutor(max_workers=MAX_ACTIVE_SESSIONS, thread_name_prefix="pr-lookup")
+atexit.register(_pr_lookup_executor.shutdown, wait=False, cancel_futures=True)
+
+
+def cancel_polling() -> None:
+    """
+    Stop all in-progress poll_session_status loops.
+    
+    Pollers spend almost all their time waiting between status checks; this
+    wakes every waiting worker thread immediately instead of letting each
+    finish a wait of up to POLL_INTERVAL_SECONDS.
+    """
+    _polling_cancelled.set()
+    for wakeup in list(_session_wakeups.values()):
+        wakeup.set()
+
+
+def reset_polling() -> None:
+    """
+    Re-arm polling after cancel_polling().
+    
+    The cancel flag is process-wide, so without this every poll and the
+    snapshot monitor of a later dispatch in the same process would stop
+    after their first check. Called by dispatch_threads() before it starts
+    any workers.
+    """
+    _polling_cancelled.clear()
+
+
+def notify_session_event(session_id: str) -> None:
+    """
+    Wake the poller of a session so it checks the status immediately.
+    
+    Called when a session is known to have changed (for example, another
+    poller's snapshot refresh saw it finish), so completion is detected
+    without waiting out the current poll interval. This is also the entry
+    point for push notifications: a webhook or event-stream handler that
+    learns of a session state change only needs to call this, and the
+    poller fetches the new status right away. Does nothing if the session
+    is not being polled.
+    
+    Args:
+        session_id: The Devin session ID
+    """
+    wakeup = _session_wakeups.get(session_id)
+    if wakeup is not None:
+        wakeup.set()
+
+
+def _wait_for_next_poll(session_id: str, seconds: float) -> bool:
+    """
+    Wait before the next status check of a session.
+    
+    Returns early if notify_session_event() or cancel_polling() is called.
+    
+    Args:
+        session_id: The Devin session ID
+        seconds: Maximum time to wait
+    
+    Returns:
+        True if polling was cancelled, False otherwise
+    """
+    wakeup = _session_wakeups.get(session_id) or _polling_cancelled
+    wakeup.wait(seconds)
+    if wakeup is not _polling_cancelled:
+        wakeup.clear()
+    return _polling_cancelled.is_set()
+
 
 def create_devin_session(
     prompt: str,
@@ -23,41 +195,39 @@ def create_devin_session(
     """
     Create a new Devin AI session with the given prompt.
     
+    Every request carries an idempotency key, so the adapter's retries of a
+    POST the server already accepted cannot create a second session. Pass a
+    stable key (e.g. built from the run and batch IDs) to also deduplicate
+    across calls; without one, a fresh key is generated for this call.
+    
     Args:
         prompt: The task prompt for Devin
-        idempotency_key: Optional key for idempotent session creation
+        idempotency_key: Key for idempotent session creation (default: a
+                         random key unique to this call)
     
     Returns:
         Session response dictionary containing session_id, or None on failure
     """
-    api_key = get_devin_api_key()
     url = f"{DEVIN_API_BASE}/sessions"
     
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    
     payload: dict[str, Any] = {
-        "prompt": prompt
+        "prompt": prompt,
+        "idempotency_key": idempotency_key or f"sentinel-{uuid.uuid4().hex}"
     }
     
-    if idempotency_key:
-        payload["idempotency_key"] = idempotency_key
-    
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=60)
+        response = _devin_session.post(url, data=orjson.dumps(payload), timeout=60)
         
         if response.status_code == 200:
-            session_data = response.json()
-            print(f"[Devin] Session created: {session_data.get('session_id', 'unknown')}")
+            session_data = orjson.loads(response.content)
+            log.info("[Devin] Session created: %s", session_data.get('session_id', 'unknown'))
             return session_data
         else:
-            print(f"[Devin] Failed to create session: {response.status_code} - {response.text}")
+            log.error("[Devin] Failed to create session: %s - %s", response.status_code, response.text)
             return None
     
-    except requests.RequestException as e:
-        print(f"[Devin] Error creating session: {e}")
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        log.error("[Devin] Error creating session: %s", e)
         return None
 
 
@@ -71,26 +241,61 @@ def get_devin_session_status(session_id: str) -> dict[str, Any] | None:
     Returns:
         Session status dictionary, or None on failure
     """
-    api_key = get_devin_api_key()
-    url = f"{DEVIN_API_BASE}/session/{session_id}"
+    session_data, _ = _fetch_session_status(session_id)
+    return session_data
+
+
+def _is_fatal_status_code(status_code: int | None) -> bool:
+    """Return True for client errors that retrying cannot fix (4xx except 408/429)."""
+    return status_code is not None and 400 <= status_code < 500 and status_code not in (408, 429)
+
+
+# Maps session ID -> (ETag or None, body digest, decoded body) of its last
+# status response. Each session is polled by a single worker thread, so no
+# lock is needed; entries are dropped when polling ends.
+_session_status_cache: dict[str, tuple[str | None, bytes, dict[str, Any]]] = {}
+
+
+def _fetch_session_status(session_id: str) -> tuple[dict[str, Any] | None, int | None]:
+    """
+    Get the status of a Devin session along with the HTTP status code.
     
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
+    Status checks are conditional GETs: when the API returned an ETag for
+    the session, If-None-Match is sent and a 304 response reuses the cached
+    body without decoding anything. Without an ETag, a 200 response whose
+    body hashes the same as the previous one is treated the same way.
+    
+    Args:
+        session_id: The session ID to query
+    
+    Returns:
+        Tuple of (session status dictionary or None on failure, HTTP status
+        code or None if no response was received). A status code of 304
+        means the status is unchanged since the previous call.
+    """
+    url = f"{DEVIN_API_BASE}/session/{session_id}"
+    cached = _session_status_cache.get(session_id)
+    headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _devin_session.get(url, headers=headers, timeout=30)
         
+        if response.status_code == 304 and cached:
+            return cached[2], 304
         if response.status_code == 200:
-            return response.json()
+            body_digest = hashlib.blake2b(response.content, digest_size=16).digest()
+            if cached and cached[1] == body_digest:
+                return cached[2], 304
+            session_data = orjson.loads(response.content)
+            _session_status_cache[session_id] = (response.headers.get("ETag"), body_digest, session_data)
+            return session_data, 200
         else:
-            print(f"[Devin] Failed to get session status: {response.status_code}")
-            return None
+            log.warning("[Devin] Failed to get session status: %s", response.status_code)
+            return None, response.status_code
     
-    except requests.RequestException as e:
-        print(f"[Devin] Error getting session status: {e}")
-        return None
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        log.warning("[Devin] Error getting session status: %s", e)
+        return None, None
 
 
 def list_devin_sessions(limit: int = 100) -> list[dict[str, Any]]:
@@ -103,49 +308,174 @@ def list_devin_sessions(limit: int = 100) -> list[dict[str, Any]]:
     Returns:
         List of session dictionaries, or empty list on failure
     """
-    api_key = get_devin_api_key()
-    url = f"{DEVIN_API_BASE}/sessions"
+    return _fetch_session_list(limit) or []
+
+
+def _fetch_session_list(limit: int = 100) -> list[dict[str, Any]] | None:
+    """
+    List Devin sessions, distinguishing a failed request from an empty list.
     
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
+    Args:
+        limit: Maximum number of sessions to return (default: 100)
+    
+    Returns:
+        List of session dictionaries, or None on failure
+    """
+    url = f"{DEVIN_API_BASE}/sessions"
     
     params = {"limit": limit}
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _devin_session.get(url, params=params, timeout=30)
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             sessions = data.get("sessions", [])
-            print(f"[Devin] Listed {len(sessions)} sessions")
+            log.info("[Devin] Listed %s sessions", len(sessions))
             return sessions
         else:
-            print(f"[Devin] Failed to list sessions: {response.status_code}")
-            return []
+            log.warning("[Devin] Failed to list sessions: %s", response.status_code)
+            return None
     
-    except requests.RequestException as e:
-        print(f"[Devin] Error listing sessions: {e}")
-        return []
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        log.warning("[Devin] Error listing sessions: %s", e)
+        return None
+
+
+# Devin statuses counted against MAX_ACTIVE_SESSIONS
+_ACTIVE_STATUSES = frozenset({"working", "running", "pending"})
+
+
+class _SessionCache:
+    """
+    Short-lived snapshot of the organization's session list.
+    
+    Every poller and get_active_session_count() read from the same snapshot,
+    which is refreshed with a single list call once it is older than the TTL.
+    A poll cycle over M sessions therefore costs one API call instead of M.
+    Sessions missing from the snapshot (e.g. beyond the list limit) or a
+    failed refresh leave callers to fall back to a per-session request.
+    
+    The list call runs outside the lock: one caller claims the refresh and
+    the others keep reading the previous snapshot meanwhile (only the very
+    first load is waited for), so a slow call never blocks every poller.
+    """
+    
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._sessions: list[dict[str, Any]] = []
+        self._by_id: dict[str, dict[str, Any]] = {}
+        self._active_count = 0
+        self._expires_at = 0.0
+        self._loaded = False
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._refreshed = threading.Condition(self._lock)
+    
+    def _refresh_if_stale(self) -> None:
+        """Reload the snapshot if it has expired; the caller must not hold the lock."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._expires_at:
+                return
+            if self._refreshing:
+                # Another caller is fetching: serve the current snapshot, or
+                # wait for the fetch if there is nothing to serve yet
+                if not self._loaded:
+                    self._refreshed.wait_for(lambda: not self._refreshing)
+                return
+            self._refreshing = True
+        
+        sessions = None
+        try:
+            sessions = _fetch_session_list() or []
+        finally:
+            with self._lock:
+                self._refreshing = False
+                if sessions is not None:
+                    self._sessions = sessions
+                    self._by_id = {s["session_id"]: s for s in sessions if "session_id" in s}
+                    self._active_count = sum(
+                        1 for s in sessions
+                        if s.get("status_enum", s.get("status", "")).lower() in _ACTIVE_STATUSES
+                    )
+                    self._expires_at = now + self._ttl
+                    self._loaded = True
+                by_id = self._by_id
+                self._refreshed.notify_all()
+        
+        for session_id, session in by_id.items():
+            if session.get("pull_request") or session.get("status_enum", session.get("status")) in _TERMINAL_STATUSES:
+                notify_session_event(session_id)
+    
+    def refresh(self) -> None:
+        """Reload the snapshot if it has expired."""
+        self._refresh_if_stale()
+    
+    def get(self, session_id: str) -> dict[str, Any] | None:
+        """Return the cached entry for a session, or None if it is not listed."""
+        self._refresh_if_stale()
+        with self._lock:
+            return self._by_id.get(session_id)
+    
+    def active_count(self) -> int:
+        """Return the number of active sessions in the current snapshot."""
+        self._refresh_if_stale()
+        with self._lock:
+            return self._active_count
+
+
+_session_cache = _SessionCache(SESSION_LIST_CACHE_TTL_SECONDS)
+
+# Background thread refreshing the snapshot while any session is polled
+_monitor_thread: threading.Thread | None = None
+_monitor_lock = threading.Lock()
+
+
+def _monitor_sessions() -> None:
+    """
+    Refresh the shared session snapshot every TTL while pollers are active.
+    
+    Each refresh wakes the pollers of sessions that have finished or opened a
+    pull request (see _SessionCache), so completion is detected within about
+    SESSION_LIST_CACHE_TTL_SECONDS for every session at the cost of a single
+    list call, however long each poller's own backoff wait has grown. The
+    thread exits once no session is being polled or polling is cancelled.
+    """
+    global _monitor_thread
+    while not _polling_cancelled.wait(SESSION_LIST_CACHE_TTL_SECONDS):
+        with _monitor_lock:
+            if not _session_wakeups:
+                _monitor_thread = None
+                return
+        _session_cache.refresh()
+    with _monitor_lock:
+        _monitor_thread = None
+
+
+def _ensure_session_monitor() -> None:
+    """Start the snapshot monitor thread unless it is already running."""
+    global _monitor_thread
+    with _monitor_lock:
+        if _monitor_thread is None:
+            _monitor_thread = threading.Thread(target=_monitor_sessions, name="session-monitor", daemon=True)
+            _monitor_thread.start()
 
 
 def get_active_session_count() -> int:
     """
     Get the count of currently active Devin sessions.
     
+    Reads the shared session-list snapshot, so repeated calls within
+    SESSION_LIST_CACHE_TTL_SECONDS do not hit the API again. The count is
+    computed once per snapshot refresh rather than on every call.
+    
     Returns:
         Number of sessions with status 'working', 'running', or 'pending'
     """
-    sessions = list_devin_sessions()
-    
-    active_statuses = {"working", "running", "pending"}
-    active_count = sum(
-        1 for s in sessions
-        if s.get("status_enum", s.get("status", "")).lower() in active_statuses
-    )
+    active_count = _session_cache.active_count()
     
-    print(f"[Devin] Active sessions: {active_count}/{MAX_ACTIVE_SESSIONS}")
+    log.info("[Devin] Active sessions: %s/%s", active_count, MAX_ACTIVE_SESSIONS)
     return active_count
 
 
@@ -154,125 +484,341 @@ def poll_session_status(
     session_url: str | None = None,
     poll_interval: int = POLL_INTERVAL_SECONDS,
     timeout: int = SESSION_TIMEOUT_SECONDS,
-    stagnation_threshold: int = STAGNATION_THRESHOLD_SECONDS
+    stagnation_threshold: int = STAGNATION_THRESHOLD_SECONDS,
+    owner: str | None = None,
+    repo: str | None = None,
+    batch_id: str = "",
+    alert_numbers: list[int] | None = None
 ) -> SessionResult:
     """
     Poll a Devin session until completion, timeout, or stagnation.
     
     This function implements the core polling loop that keeps worker threads
     alive while Sub-Devin is actively coding. It includes:
-    - Regular polling every 150 seconds (configurable)
+    - Immediate first check: the status is read as soon as polling starts,
+      so a session that is already finished never waits out an interval
+    - Exponential backoff: the first wait is 10 seconds and doubles after each
+      poll up to poll_interval (150 seconds), plus a few seconds of jitter;
+      the wait drops back to 10 seconds whenever the session shows progress
+    - Adaptive scheduling: once enough past completion times are recorded,
+      polls are placed at quantiles of that distribution instead (never more
+      than poll_interval apart), so checks cluster around likely completion;
+      once the last scheduled point has passed, polls are poll_interval apart
     - 20-minute timeout (configurable)
     - Stagnation detection: marks session as "stuck" if no new logs for 5 minutes
+    - Retry backoff: failed status checks are retried after a wait that grows
+      by POLL_RETRY_BACKOFF_FACTOR per consecutive failure (reset on success);
+      non-retryable 4xx responses end polling immediately
+    - Cancellation: waits return early once cancel_polling() is called
+    - Shared snapshot: status is read from the session-list cache that all
+      pollers share, with a per-session request only if it is not listed
+    - Early wake-up: a wait ends as soon as notify_session_event() is called
+      for the session, e.g. when a snapshot refresh shows it has finished;
+      a background monitor refreshes the snapshot every
+      SESSION_LIST_CACHE_TTL_SECONDS while any session is being polled
+    - PR detection: when owner and repo are given and a session finishes or
+      is blocked without reporting a pull request, GitHub is searched once
+      for one linking the session (bounded by PR_LOOKUP_TIMEOUT_SECONDS),
+      so a PR the Devin API has not picked up yet still counts
     
     Args:
         session_id: The Devin session ID to monitor
         session_url: The session URL from the API (for linking in reports)
-        poll_interval: Seconds between status checks (default: 150)
+        poll_interval: Maximum seconds between status checks (default: 150)
         timeout: Maximum seconds to wait for completion (default: 1200)
         stagnation_threshold: Seconds without progress before marking stuck (default: 300)
+        owner: GitHub repository owner, enables the pull request lookup
+        repo: GitHub repository name, enables the pull request lookup
+        batch_id: Batch identifier to record in the result
+        alert_numbers: Alert numbers of the batch to record in the result
     
     Returns:
-        SessionResult with status (success, failure, partial, stuck, timeout)
+        SessionResult with status (success, failure, partial, stuck, timeout),
+        carrying the given batch_id and alert_numbers
     """
-    start_time = time.time()
+    _session_wakeups[session_id] = threading.Event()
+    _ensure_session_monitor()
+    try:
+        return _poll_until_done(
+            session_id, session_url, poll_interval, timeout, stagnation_threshold, owner, repo,
+            batch_id, alert_numbers if alert_numbers is not None else []
+        )
+    finally:
+        _session_wakeups.pop(session_id, None)
+        _session_status_cache.pop(session_id, None)
+
+
+def _poll_until_done(
+    session_id: str,
+    session_url: str | None,
+    poll_interval: int,
+    timeout: int,
+    stagnation_threshold: int,
+    owner: str | None,
+    repo: str | None,
+    batch_id: str,
+    alert_numbers: list[int]
+) -> SessionResult:
+    """Run the polling loop of poll_session_status() (see there for details)."""
+    start_time = time.monotonic()
     last_activity_time = start_time
     last_status_message = ""
-    last_structured_output = None
+    last_output_digest = b""
+    last_listed_data = None
+    delay = min(POLL_INITIAL_INTERVAL_SECONDS, poll_interval)
+    consecutive_failures = 0
+    schedule = _adaptive_poll_schedule(_load_poll_history(), timeout, poll_interval)
     
-    print(f"[Poll] Starting to monitor session {session_id}")
-    print(f"[Poll] Timeout: {timeout}s, Poll interval: {poll_interval}s, Stagnation threshold: {stagnation_threshold}s")
+    log.info("[Poll] Starting to monitor session %s", session_id)
+    log.info("[Poll] Timeout: %ss, Poll interval: %ss, Stagnation threshold: %ss", timeout, poll_interval, stagnation_threshold)
     
     while True:
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         
         if elapsed > timeout:
-            print(f"[Poll] Session {session_id} timed out after {elapsed:.0f}s")
+            log.warning("[Poll] Session %s timed out after %.0fs", session_id, elapsed)
             return SessionResult(
                 status=SessionStatus.TIMEOUT,
                 session_id=session_id,
-                batch_id="",
-                alert_numbers=[],
+                batch_id=batch_id,
+                alert_numbers=alert_numbers,
                 session_url=session_url,
                 error_message=f"Session timed out after {timeout} seconds"
             )
         
-        session_data = get_devin_session_status(session_id)
+        session_data = _session_cache.get(session_id)
+        if session_data is None:
+            session_data, http_status = _fetch_session_status(session_id)
+        elif session_data is last_listed_data:
+            http_status = 304
+        else:
+            last_listed_data, http_status = session_data, 200
         
         if session_data is None:
-            print(f"[Poll] Failed to get status for session {session_id}, will retry...")
-            time.sleep(poll_interval)
+            if _is_fatal_status_code(http_status):
+                log.error("[Poll] Status check for session %s failed with HTTP %s, giving up", session_id, http_status)
+                return SessionResult(
+                    status=SessionStatus.FAILURE,
+                    session_id=session_id,
+                    batch_id=batch_id,
+                    alert_numbers=alert_numbers,
+                    session_url=session_url,
+                    error_message=f"Session status request failed with HTTP {http_status}"
+                )
+            consecutive_failures += 1
+            retry_wait = min(POLL_INITIAL_INTERVAL_SECONDS * POLL_RETRY_BACKOFF_FACTOR ** consecutive_failures, poll_interval)
+            retry_wait += random.uniform(0, POLL_JITTER_SECONDS)
+            log.warning("[Poll] Failed to get status for session %s, retrying in %.0fs...", session_id, retry_wait)
+            if _wait_for_next_poll(session_id, retry_wait):
+                return _cancelled_result(session_id, session_url, batch_id, alert_numbers)
             continue
         
+        consecutive_failures = 0
+        
         status = session_data.get("status_enum", session_data.get("status", "unknown"))
         status_message = session_data.get("status_message", "")
-        structured_output = session_data.get("structured_output")
         
-        if status_message != last_status_message or structured_output != last_structured_output:
-            last_activity_time = time.time()
-            last_status_message = status_message
-            last_structured_output = structured_output
-            print(f"[Poll] Session {session_id} - Status: {status}, Message: {status_message[:100] if status_message else 'N/A'}...")
+        if http_status != 304:
+            output_digest = _structured_output_digest(session_data.get("structured_output"))
+            if status_message != last_status_message or output_digest != last_output_digest:
+                last_activity_time = time.monotonic()
+                last_status_message = status_message
+                last_output_digest = output_digest
+                delay = min(POLL_INITIAL_INTERVAL_SECONDS, poll_interval)
+                log.info("[Poll] Session %s - Status: %s, Message: %.100s...", session_id, status, status_message or "N/A")
         
-        stagnation_time = time.time() - last_activity_time
+        stagnation_time = time.monotonic() - last_activity_time
         if stagnation_time > stagnation_threshold:
-            print(f"[Poll] Session {session_id} appears stuck (no activity for {stagnation_time:.0f}s)")
+            log.warning("[Poll] Session %s appears stuck (no activity for %.0fs)", session_id, stagnation_time)
             return SessionResult(
                 status=SessionStatus.STUCK,
                 session_id=session_id,
-                batch_id="",
-                alert_numbers=[],
+                batch_id=batch_id,
+                alert_numbers=alert_numbers,
                 session_url=session_url,
                 error_message=f"Session stagnated for {stagnation_time:.0f} seconds"
             )
         
+        terminal = _TERMINAL_STATUSES.get(status)
+        final_status, fixed_message = terminal if terminal is not None else (None, None)
+        
         pull_request = session_data.get("pull_request")
         pr_url = pull_request.get("url") if pull_request else None
+        if not pr_url and owner and repo and status in _PR_LOOKUP_STATUSES:
+            pr_url = _lookup_session_pull_request(owner, repo, session_id)
         
-        if pr_url:
-            print(f"[Poll] Session {session_id} has PR: {pr_url} - marking as success")
+        if final_status is SessionStatus.FAILURE and fixed_message is None:
+            error_msg = status_message or f"Session ended with status: {status}"
+            log.warning("[Poll] Session %s failed: %s", session_id, error_msg)
+            _record_completion_time(elapsed)
             return SessionResult(
-                status=SessionStatus.SUCCESS,
+                status=SessionStatus.FAILURE,
                 session_id=session_id,
-                batch_id="",
-                alert_numbers=[],
+                batch_id=batch_id,
+                alert_numbers=alert_numbers,
                 pr_url=pr_url,
-                session_url=session_url
+                session_url=session_url,
+                error_message=error_msg
             )
         
-        if status in ("finished", "completed", "success"):
-            print(f"[Poll] Session {session_id} completed successfully")
+        if pr_url or final_status is SessionStatus.SUCCESS:
+            if pr_url:
+                log.info("[Poll] Session %s has PR: %s - marking as success", session_id, pr_url)
+            else:
+                log.info("[Poll] Session %s completed successfully", session_id)
+            _record_completion_time(elapsed)
             return SessionResult(
                 status=SessionStatus.SUCCESS,
                 session_id=session_id,
-                batch_id="",
-                alert_numbers=[],
+                batch_id=batch_id,
+                alert_numbers=alert_numbers,
                 pr_url=pr_url,
                 session_url=session_url
             )
         
-        if status in ("failed", "error", "cancelled"):
-            error_msg = status_message or f"Session ended with status: {status}"
-            print(f"[Poll] Session {session_id} failed: {error_msg}")
-            return SessionResult(
-                status=SessionStatus.FAILURE,
-                session_id=session_id,
-                batch_id="",
-                alert_numbers=[],
-                session_url=session_url,
-                error_message=error_msg
-            )
-        
-        if status == "blocked":
-            print(f"[Poll] Session {session_id} is blocked (no PR found), treating as failure")
+        if final_status is SessionStatus.FAILURE:
+            log.warning("[Poll] Session %s is blocked (no PR found), treating as failure", session_id)
             return SessionResult(
                 status=SessionStatus.FAILURE,
                 session_id=session_id,
-                batch_id="",
-                alert_numbers=[],
+                batch_id=batch_id,
+                alert_numbers=alert_numbers,
                 session_url=session_url,
-                error_message="Session is blocked and requires manual intervention"
+                error_message=fixed_message
             )
         
-        print(f"[Poll] Session {session_id} still running (elapsed: {elapsed:.0f}s, status: {status})")
-        time.sleep(poll_interval)
+        log.info("[Poll] Session %s still running (elapsed: %.0fs, status: %s)", session_id, elapsed, status)
+        upcoming = [point - elapsed for point in schedule if point > elapsed + POLL_INITIAL_INTERVAL_SECONDS]
+        if upcoming:
+            wait = min(upcoming[0], poll_interval)
+        elif schedule:
+            # Slower than every recorded completion: keep the sparse cadence
+            # instead of restarting the backoff at its shortest wait
+            wait = poll_interval
+        else:
+            wait = delay
+            delay = min(delay * 2, poll_interval)
+        if _wait_for_next_poll(session_id, wait + random.uniform(0, POLL_JITTER_SECONDS)):
+            return _cancelled_result(session_id, session_url, batch_id, alert_numbers)
+
+
+def _lookup_session_pull_request(owner: str, repo: str, session_id: str) -> str | None:
+    """
+    Search GitHub for a PR the Devin API has not reported yet.
+    
+    Only called once a session has finished or is blocked, so each session
+    is searched at most once. The search runs on the pr-lookup executor and
+    is abandoned after PR_LOOKUP_TIMEOUT_SECONDS, so a lookup waiting on the
+    token pool or on adapter retries cannot stall the poll; a lookup still
+    queued at that point is cancelled. A timeout is treated as "no PR".
+    
+    Args:
+        owner: GitHub repository owner
+        repo: GitHub repository name
+        session_id: Devin session ID
+    
+    Returns:
+        The pull request URL, or None if none was found in time
+    """
+    lookup = _pr_lookup_executor.submit(find_session_pull_request, owner, repo, session_id)
+    try:
+        pr_url = lookup.result(timeout=PR_LOOKUP_TIMEOUT_SECONDS)
+    except TimeoutError:
+        lookup.cancel()
+        log.warning("[Poll] PR lookup for session %s took longer than %ss, skipping it", session_id, PR_LOOKUP_TIMEOUT_SECONDS)
+        return None
+    if pr_url:
+        log.info("[Poll] Found PR for session %s on GitHub before the Devin API reported it", session_id)
+    return pr_url
+
+
+def _structured_output_digest(structured_output: Any) -> bytes:
+    """
+    Return a short digest of a session's structured output.
+    
+    The stagnation check only needs to know whether the output changed, so
+    the poll loop keeps an 8-byte hash of the canonical JSON instead of the
+    previous (possibly large) output itself.
+    
+    Args:
+        structured_output: The structured_output field of a status response
+    
+    Returns:
+        The digest, or b"" if there is no output
+    """
+    if not structured_output:
+        return b""
+    return hashlib.blake2b(orjson.dumps(structured_output, option=orjson.OPT_SORT_KEYS), digest_size=8).digest()
+
+
+_poll_history_lock = threading.Lock()
+
+
+def _poll_history_path() -> str:
+    """Return the path of the completion-time history file."""
+    return os.path.join(os.getenv("SENTINEL_CACHE_DIR") or tempfile.gettempdir(), POLL_HISTORY_FILENAME)
+
+
+def _load_poll_history() -> list[float]:
+    """Load past session completion times (seconds), ignoring a missing or corrupt file."""
+    try:
+        with open(_poll_history_path(), "rb") as f:
+            return [float(t) for t in orjson.loads(f.read())]
+    except (OSError, ValueError, TypeError):
+        return []
+
+
+def _record_completion_time(elapsed: float) -> None:
+    """Append a session completion time to the history file, keeping the newest samples."""
+    with _poll_history_lock:
+        history = _load_poll_history()
+        history.append(round(elapsed, 1))
+        try:
+            path = _poll_history_path()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(history[-POLL_HISTORY_MAX_SAMPLES:]))
+        except OSError as e:
+            log.warning("[Poll] Failed to record completion time: %s", e)
+
+
+def _adaptive_poll_schedule(history: list[float], timeout: int, poll_interval: int) -> list[float]:
+    """
+    Place a fixed budget of polls at equal-probability points of past completions.
+    
+    With timeout / poll_interval polls to spend, each poll is scheduled at the
+    next quantile of the empirical completion-time distribution, so polls are
+    sparse early in a session (when completion is unlikely) and dense around
+    the typical completion time.
+    
+    Args:
+        history: Past session completion times in seconds
+        timeout: Session timeout in seconds
+        poll_interval: Maximum seconds between status checks
+    
+    Returns:
+        Ascending elapsed-time offsets to poll at, or an empty list when there
+        are fewer than POLL_HISTORY_MIN_SAMPLES samples
+    """
+    if len(history) < POLL_HISTORY_MIN_SAMPLES:
+        return []
+    samples = sorted(history)
+    budget = max(1, timeout // poll_interval)
+    points = {
+        samples[min(len(samples) - 1, (len(samples) * i) // budget)]
+        for i in range(1, budget + 1)
+    }
+    return sorted(p for p in points if 0 < p < timeout)
+
+
+def _cancelled_result(session_id: str, session_url: str | None, batch_id: str, alert_numbers: list[int]) -> SessionResult:
+    """Build the result returned by a poller woken by cancel_polling()."""
+    log.info("[Poll] Polling cancelled for session %s", session_id)
+    return SessionResult(
+        status=SessionStatus.FAILURE,
+        session_id=session_id,
+        batch_id=batch_id,
+        alert_numbers=alert_numbers,
+        session_url=session_url,
+        error_message="Polling cancelled before the session finished"
+    )
@@ -18,7 +18,9 @@ The orchestrator acts as a thin coordination layer that brings together
 all these components into a cohesive workflow.
 """
 
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 # Import all models and configuration from devin module
@@ -37,12 +39,16 @@ from scripts.devin.DO_session import (
     get_active_session_count,
 )
 from scripts.devin.DO_batch_processor import (
+    build_batch_prompt,
     dispatch_threads,
 )
 from scripts.termination_logic import (
     get_available_session_slots,
 )
 from scripts.slack_client import SentinelDashboard
+from scripts.sentinel_logging import configure_logging
+
+log = logging.getLogger(__name__)
 
 
 def run_orchestrator(
@@ -50,7 +56,8 @@ def run_orchestrator(
     owner: str | None = None,
     repo: str | None = None,
     max_workers: int = MAX_WORKERS_DEFAULT,
-    slack_channel_id: str | None = None
+    slack_channel_id: str | None = None,
+    run_id: str | None = None
 ) -> list[SessionResult]:
     """
     Main entry point for the Security Sentinel Orchestrator.
@@ -69,6 +76,8 @@ def run_orchestrator(
         repo: GitHub repository name (defaults to env var GITHUB_REPO)
         max_workers: Maximum concurrent worker threads (default: 3)
         slack_channel_id: Optional Slack channel ID for dashboard updates (overrides env var)
+        run_id: Identifier of this run for Devin session idempotency keys
+                (default: GITHUB_RUN_ID, or a random UUID outside Actions)
     
     Returns:
         List of SessionResult objects for all processed batches
@@ -90,53 +99,68 @@ def run_orchestrator(
         >>> 
         >>> results = run_orchestrator(batches, owner="owner", repo="repo")
     """
+    configure_logging()
+    
     owner = owner or os.getenv("GITHUB_OWNER", "")
     repo = repo or os.getenv("GITHUB_REPO", "")
     
     if not owner or not repo:
         raise ValueError("Repository owner and name must be provided or set via GITHUB_OWNER/GITHUB_REPO env vars")
     
-    print("\n" + "=" * 60)
-    print("     SECURITY SENTINEL ORCHESTRATOR")
-    print("=" * 60)
-    print(f"\nRepository: {owner}/{repo}")
-    print(f"Batches to process: {len(batches)}")
-    print(f"Max workers: {max_workers}")
-    print(f"Max active sessions: {MAX_ACTIVE_SESSIONS}")
+    log.info("=" * 60)
+    log.info("     SECURITY SENTINEL ORCHESTRATOR")
+    log.info("=" * 60)
+    log.info("Repository: %s/%s", owner, repo)
+    log.info("Batches to process: %s", len(batches))
+    log.info("Max workers: %s", max_workers)
+    log.info("Max active sessions: %s", MAX_ACTIVE_SESSIONS)
     
     if not batches:
-        print("\nNo batches to process. Exiting.")
+        log.info("No batches to process. Exiting.")
         return []
     
     for batch_id, batch_data in batches.items():
         tasks = batch_data.get("tasks", [])
         severity = batch_data.get("severity", 0)
-        print(f"  - {batch_id}: {len(tasks)} tasks, severity {severity}")
+        log.info("  - %s: %s tasks, severity %s", batch_id, len(tasks), severity)
     
     try:
         get_github_token()
         get_devin_api_key()
     except ValueError as e:
-        print(f"\nConfiguration error: {e}")
+        log.error("Configuration error: %s", e)
         return []
     
-    print("\n[Pre-flight] Checking available session capacity...")
-    available_slots = get_available_session_slots()
+    log.info("[Pre-flight] Checking available session capacity...")
+    # Render the prompts of the batches dispatched first (most severe) while
+    # the capacity check waits on the Devin API. Only one batch per session
+    # slot can start right away, so rendering stops at MAX_ACTIVE_SESSIONS
+    # prompts, or at the slot count once it is known (none for 0 slots);
+    # later batches build their prompt in the worker.
+    prioritized = sorted(batches.items(), key=lambda item: item[1].get("severity") or 0, reverse=True)
+    prompts: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        slots_future = executor.submit(get_available_session_slots)
+        for batch_id, batch_data in prioritized[:MAX_ACTIVE_SESSIONS]:
+            if slots_future.done() and len(prompts) >= slots_future.result():
+                break
+            prompts[batch_id] = build_batch_prompt(batch_id, batch_data, owner, repo)
+        available_slots = slots_future.result()
     
     if available_slots == 0:
         active_count = get_active_session_count()
-        print(f"\n[Pre-flight] ERROR: No session slots available ({active_count}/{MAX_ACTIVE_SESSIONS} active)")
-        print("[Pre-flight] All sessions are currently active. Please wait for them to complete.")
-        print("[Pre-flight] To manually clean up sessions, use: from scripts.termination_logic import cleanup_sentinel_sessions")
+        log.error("[Pre-flight] ERROR: No session slots available (%s/%s active)", active_count, MAX_ACTIVE_SESSIONS)
+        log.info("[Pre-flight] All sessions are currently active. Please wait for them to complete.")
+        log.info("[Pre-flight] To manually clean up sessions, use: from scripts.termination_logic import cleanup_sentinel_sessions")
         return []
     
-    print(f"\n[Pre-flight] Session slots available: {available_slots}/{MAX_ACTIVE_SESSIONS}")
+    log.info("[Pre-flight] Session slots available: %s/%s", available_slots, MAX_ACTIVE_SESSIONS)
     
-    print("\nStarting remediation...")
+    log.info("Starting remediation...")
     
     dashboard = SentinelDashboard(batch_names=list(batches.keys()), channel_id=slack_channel_id)
     
-    results = dispatch_threads(batches, owner, repo, max_workers, available_slots, dashboard)
+    results = dispatch_threads(batches, owner, repo, max_workers, available_slots, dashboard, run_id, prompts)
     
     dashboard.finalize_report(results)
     
@@ -146,52 +170,8 @@ def run_orchestrator(
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) < 3:
-        print("Usage: python devin_orchestrator.py <owner> <repo>")
-        print("\nThis script requires the following environment variables:")
-        print("  GH_TOKEN - GitHub Personal Access Token")
-        print("  DEVIN_API_KEY - Devin AI API Key")
-        sys.exit(1)
-    
     from dotenv import load_dotenv
     load_dotenv()
-    target_owner = sys.argv[1]
-    target_repo = sys.argv[2]
-    
-    from github_client import GitHubClient
-    from parse_sarif import (
-        build_active_alert_index,
-        minify_sarif_state_aware,
-        get_remediation_batches_state_aware
-    )
-    
-    print(f"Fetching security data for {target_owner}/{target_repo}...")
-    
-    client = GitHubClient(target_owner, target_repo)
-    
-    alerts = client.get_active_alerts()
-    if not alerts:
-        print("No active alerts found.")
-        sys.exit(0)
-    
-    print(f"Found {len(alerts)} active alerts")
-    
-    alert_index = build_active_alert_index(alerts)
     
-    sarif_data = client.get_sarif_data()
-    if not sarif_data:
-        print("Failed to fetch SARIF data.")
-        sys.exit(1)
-    
-    minified = minify_sarif_state_aware(sarif_data, alert_index)
-    print(f"Minified to {len(minified)} results matching active alerts")
-    
-    remediation_batches = get_remediation_batches_state_aware(minified)
-    print(f"Created {len(remediation_batches)} remediation batches")
-    
-    run_orchestrator(remediation_batches, owner=target_owner, repo=target_repo)
-
-
-
-
-
+    from scripts.pipeline import parse_argv, run
+    sys.exit(run(*parse_argv()))
@@ -11,16 +11,92 @@ analyze repositories for security vulnerabilities using tools like CodeQL.
 Environment Variables:
     GH_TOKEN: GitHub Personal Access Token with 'security_events' read permission.
               Required for API authentication.
+    SENTINEL_CACHE_DIR: Optional directory used to persist conditional-request
+              caches (ETags and response bodies) between runs.
 
 Example:
     >>> from scripts.github_client import GitHubClient
-    >>> client = GitHubClient('owner', 'repo')
-    >>> alerts = client.get_active_alerts()
-    >>> sarif = client.get_sarif_data()
+    >>> with GitHubClient('owner', 'repo') as client:
+    ...     alerts = client.get_active_alerts()
+    ...     sarif = client.get_sarif_data()
 """
 
+import gzip
+import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
+from urllib.parse import urlencode
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+log = logging.getLogger(__name__)
+
+# Upper bound on concurrent SARIF downloads (one per language analysis)
+SARIF_FETCH_WORKERS = 8
+
+# File name of the persisted ETag cache inside SENTINEL_CACHE_DIR
+ETAG_CACHE_FILENAME = ".sentinel_etag_cache.json"
+
+# Largest page size accepted by the REST API; fewer pages means fewer round trips
+PER_PAGE_MAX = 100
+
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+# Rule fields read when mapping results to severities; help texts and descriptions are dropped
+SARIF_RULE_FIELDS = ("id", "properties", "defaultConfiguration")
+
+# Tool component fields kept alongside the trimmed rules
+SARIF_COMPONENT_FIELDS = ("name", "version", "semanticVersion")
+
+
+def _trim_tool_component(component: dict) -> dict:
+    """Copy a SARIF tool component, keeping only its identity and the rule fields the parser reads."""
+    trimmed = {key: component[key] for key in SARIF_COMPONENT_FIELDS if key in component}
+    trimmed["rules"] = [
+        {key: rule[key] for key in SARIF_RULE_FIELDS if key in rule}
+        for rule in component.get("rules", [])
+    ]
+    return trimmed
+
+
+def _trim_sarif_run(run: dict) -> dict:
+    """
+    Reduce a SARIF run to the sections used to build remediation batches.
+
+    CodeQL runs carry the full Markdown help of every rule in the query
+    suite, plus artifacts, invocations and other metadata that the parser
+    never reads. Keeping only the results and the rule severities makes the
+    cached, merged and memoized SARIF a fraction of the downloaded size.
+
+    Args:
+        run: A decoded SARIF run object.
+
+    Returns:
+        A new run holding only 'tool' (with trimmed rules) and 'results'.
+    """
+    tool = run.get("tool", {})
+    trimmed_tool = {"driver": _trim_tool_component(tool.get("driver", {}))}
+    if "extensions" in tool:
+        trimmed_tool["extensions"] = [_trim_tool_component(extension) for extension in tool["extensions"]]
+    return {"tool": trimmed_tool, "results": run.get("results", [])}
+
+
+class _BearerAuth(requests.auth.AuthBase):
+    """Attach the client's token at send time so it is never stored on the session."""
+
+    def __init__(self, client: "GitHubClient"):
+        self._client = client
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        request.headers["Authorization"] = f"Bearer {self._client.token}"
+        return request
 
 
 class GitHubClient:
@@ -38,6 +114,19 @@ class GitHubClient:
         self.repo = repo
         self.codescan_url = f"https://api.github.com/repos/{owner}/{repo}/code-scanning/alerts"
         self.analyses_url = f"https://api.github.com/repos/{owner}/{repo}/code-scanning/analyses"
+        self._session = self._create_session()
+        # Maps request key -> (etag, decoded body) for conditional GETs
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
+        self._etag_lock = threading.Lock()
+        # Set when the ETag cache changed since it was last written to disk
+        self._etag_dirty = False
+        self._etag_save_lock = threading.Lock()
+        # Maps ref -> merged SARIF, so a run downloads each ref's SARIF once
+        self._sarif_by_ref: dict[str, dict] = {}
+        self._sarif_lock = threading.Lock()
+        self._cache_dir = os.getenv("SENTINEL_CACHE_DIR") or None
+        self._etag_cache_path = os.path.join(self._cache_dir, ETAG_CACHE_FILENAME) if self._cache_dir else None
+        self._load_etag_cache()
         self.branch = branch if branch is not None else self._get_default_branch()
 
     @property
@@ -48,6 +137,167 @@ class GitHubClient:
             raise ValueError("GH_TOKEN environment variable is not set and no token was provided")
         return token_value
 
+    def close(self) -> None:
+        """Persist pending ETag cache changes and close the pooled HTTP session."""
+        self._save_etag_cache()
+        self._session.close()
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Build the pooled HTTP session shared by every request of this client.
+
+        Reusing one session keeps TCP+TLS connections alive between calls and
+        retries transient failures (429/5xx) without reopening the connection.
+        """
+        session = requests.Session()
+        session.auth = _BearerAuth(self)
+        session.headers.update({"Accept": "application/vnd.github+json"})
+        retry = Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+        session.mount("https://", adapter)
+        return session
+
+    def _load_etag_cache(self) -> None:
+        """Load persisted ETags from disk, ignoring a missing or corrupt cache file."""
+        if not self._etag_cache_path or not os.path.exists(self._etag_cache_path):
+            return
+        try:
+            with open(self._etag_cache_path, "rb") as f:
+                persisted = orjson.loads(f.read())
+            self._etag_cache = {key: (etag, body) for key, (etag, body) in persisted.items()}
+        except (OSError, ValueError, TypeError) as e:
+            log.warning("Ignoring unreadable ETag cache %s: %s", self._etag_cache_path, e)
+
+    def _save_etag_cache(self) -> None:
+        """
+        Persist the ETag cache to disk if it changed and a cache directory is configured.
+
+        Called once after each paginated listing and from close(), rather than
+        after every response, so paging through N pages writes the file once
+        instead of N times. The cache is serialized under the ETag lock but
+        written outside it, so concurrent requests are not blocked on disk I/O.
+        """
+        if not self._etag_cache_path:
+            return
+        with self._etag_save_lock:
+            with self._etag_lock:
+                if not self._etag_dirty:
+                    return
+                payload = orjson.dumps(self._etag_cache)
+                self._etag_dirty = False
+            try:
+                os.makedirs(os.path.dirname(self._etag_cache_path), exist_ok=True)
+                with open(self._etag_cache_path, "wb") as f:
+                    f.write(payload)
+            except OSError as e:
+                log.warning("Failed to persist ETag cache: %s", e)
+
+    def _conditional_get(self, url: str, headers: dict | None = None, params: dict | None = None) -> tuple[int, Any]:
+        """
+        Perform a GET that revalidates a cached body with If-None-Match.
+
+        GitHub answers an unchanged resource with 304 Not Modified, which has no
+        body and does not count against the primary rate limit. In that case the
+        cached body is returned instead of re-downloading it.
+
+        Args:
+            url (str): The URL to request.
+            headers (dict, optional): Extra request headers (not modified).
+            params (dict, optional): Query parameters.
+
+        Returns:
+            tuple[int, Any]: The HTTP status code and decoded JSON body. A
+                revalidated cache hit is reported as 200 with the cached body;
+                other non-200 responses return None as the body.
+        """
+        key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        cached = self._etag_cache.get(key)
+
+        request_headers = dict(headers or {})
+        if cached:
+            request_headers["If-None-Match"] = cached[0]
+
+        response = self._session.get(url, headers=request_headers, params=params)
+
+        if response.status_code == 304:
+            if cached:
+                return 200, cached[1]
+            # Server claims we hold a copy we do not have; refetch unconditionally
+            response = self._session.get(url, headers=headers, params=params)
+
+        if response.status_code != 200:
+            return response.status_code, None
+
+        body = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, body)
+                self._etag_dirty = True
+        return 200, body
+
+    def _iter_pages(self, url: str, params: dict) -> Iterator[Any]:
+        """
+        Yield every item of a list endpoint, one maximum-size page at a time.
+
+        Pages are requested lazily as the caller consumes items, so only one
+        page is held in memory by this method. Each page goes through the
+        conditional-request cache, so unchanged pages cost a 304. Paging stops
+        at the first short page, after which the ETag cache is saved once.
+
+        Args:
+            url (str): The list endpoint URL.
+            params (dict): Query parameters (per_page/page are set here).
+
+        Yields:
+            Any: The decoded items of each page, in order.
+
+        Raises:
+            requests.HTTPError: If a page request does not return 200.
+        """
+        page = 1
+        try:
+            while True:
+                page_params = {**params, "per_page": PER_PAGE_MAX, "page": page}
+                status_code, page_items = self._conditional_get(url, params=page_params)
+                if status_code != 200:
+                    raise requests.HTTPError(f"{url} page {page} returned {status_code}")
+                yield from page_items
+                if len(page_items) < PER_PAGE_MAX:
+                    return
+                page += 1
+        finally:
+            self._save_etag_cache()
+
+    def iter_active_alerts(self) -> Iterator[dict]:
+        """
+        Stream the active, unassigned code scanning alerts of the branch.
+
+        Alerts are yielded as each page arrives, so consumers such as
+        build_active_alert_index() can start work before the last page is
+        downloaded.
+
+        Yields:
+            dict: One code scanning alert.
+
+        Raises:
+            requests.HTTPError: If any page request fails.
+        """
+        #only get alerts not already assigned to someone in the organization
+        params = {"state": "open", "assignees" : "none", "ref": self.branch}
+        return self._iter_pages(self.codescan_url, params)
+
     #add severity filer later
     def get_active_alerts(self, severity: list[str] = None) -> dict:
         """
@@ -59,21 +309,15 @@ class GitHubClient:
         Returns:
             dict: A dictionary containing the active code scanning alerts.
         """
-        headers = {"Accept": "application/vnd.github+json", "Authorization": f"Bearer {self.token}"}
-        #only get alerts not already assigned to someone in the organization
-        
-        params = {"state": "open", "assignees" : "none", "ref": self.branch, "per_page": 100}
-
-        response = requests.get(self.codescan_url, headers=headers, params=params)
-        if response.status_code == 200:
-            alerts = response.json()
-            # if severity:
-            #     sev_set = set(s.lower() for s in severity)
-            #     alerts = [a for a in alerts if a.get("rule", {}).get("security_severity_level", "") in sev_set]
-            return alerts
-        else:
-            print(f"Failed to fetch code scanning alerts: {response.status_code}")
+        try:
+            alerts = list(self.iter_active_alerts())
+        except requests.HTTPError as e:
+            log.warning("Failed to fetch code scanning alerts: %s", e)
             return {}
+        # if severity:
+        #     sev_set = set(s.lower() for s in severity)
+        #     alerts = [a for a in alerts if a.get("rule", {}).get("security_severity_level", "") in sev_set]
+        return alerts
 
     def _get_latest_analysis_ids_by_category(self) -> dict[str, int]:
         """
@@ -93,13 +337,12 @@ class GitHubClient:
                 "/language:python": 914192873
             }
         """
-        headers = {"Accept": "application/vnd.github+json", "Authorization": f"Bearer {self.token}"}
         params = {"ref": self.branch, "per_page": 100}
-        response = requests.get(self.analyses_url, headers=headers, params=params)
-        if response.status_code == 200:
-            analyses = response.json()
+        status_code, analyses = self._conditional_get(self.analyses_url, params=params)
+        self._save_etag_cache()
+        if status_code == 200:
             if not analyses:
-                print("No analyses found.")
+                log.info("No analyses found.")
                 return {}
 
             latest_by_category: dict[str, int] = {}
@@ -111,10 +354,10 @@ class GitHubClient:
 
             return latest_by_category
         else:
-            print(f"Failed to fetch analyses: {response.status_code}")
+            log.warning("Failed to fetch analyses: %s", status_code)
             return {}
     
-    def get_sarif_data(self) -> dict:
+    def get_sarif_data(self, refresh: bool = False) -> dict:
         """
         Fetches and merges SARIF data from all language analyses.
 
@@ -122,6 +365,15 @@ class GitHubClient:
         This method fetches SARIF from each language's latest analysis and merges
         them into a single SARIF structure with combined runs.
 
+        The merged result is kept in memory per branch, so later calls on the
+        same client (e.g. repeated runs in one process) return it without any
+        API call. Concurrent callers wait for a single download. Empty results
+        are not kept, so a failed fetch is retried on the next call.
+
+        Args:
+            refresh (bool, optional): Bypass the in-memory copy and fetch again.
+                Defaults to False.
+
         Returns:
             dict: A merged SARIF dictionary containing runs from all language analyses.
                   Returns empty dict if no analyses are found.
@@ -130,25 +382,105 @@ class GitHubClient:
             The returned SARIF will have a 'runs' array containing results from
             all languages (e.g., both JavaScript and Python vulnerabilities).
         """
+        with self._sarif_lock:
+            if not refresh and self.branch in self._sarif_by_ref:
+                return self._sarif_by_ref[self.branch]
+            merged_sarif = self._fetch_sarif_data()
+            if merged_sarif:
+                self._sarif_by_ref[self.branch] = merged_sarif
+            return merged_sarif
+
+    def _fetch_sarif_data(self) -> dict:
+        """
+        Download and merge the SARIF of every category's latest analysis.
+
+        Returns:
+            dict: The merged SARIF dictionary, or an empty dict if no analyses
+                  or SARIF runs are found.
+        """
         analysis_ids_by_category = self._get_latest_analysis_ids_by_category()
         if not analysis_ids_by_category:
             return {}
 
-        headers = {"Accept": "application/sarif+json", "Authorization": f"Bearer {self.token}"}
         merged_sarif: dict = {"$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json", "version": "2.1.0", "runs": []}
 
-        for category, analysis_id in analysis_ids_by_category.items():
-            sarif_url = f"{self.analyses_url}/{analysis_id}"
-            response = requests.get(sarif_url, headers=headers)
-            if response.status_code == 200:
-                sarif_data = response.json()
-                runs = sarif_data.get("runs", [])
+        # Each category is an independent download, so overlap them instead of
+        # paying one full round trip per language in sequence.
+        workers = min(SARIF_FETCH_WORKERS, len(analysis_ids_by_category))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sarif_per_category = executor.map(
+                self._get_analysis_sarif,
+                analysis_ids_by_category.keys(),
+                analysis_ids_by_category.values(),
+            )
+            for runs in sarif_per_category:
                 merged_sarif["runs"].extend(runs)
-            else:
-                print(f"Failed to fetch SARIF data for category {category}: {response.status_code}")
 
         return merged_sarif if merged_sarif["runs"] else {}
     
+    def _get_analysis_sarif(self, category: str, analysis_id: int) -> list[dict]:
+        """
+        Fetches the SARIF runs for a single analysis.
+
+        Args:
+            category (str): The analysis category (used for error reporting).
+            analysis_id (int): The code scanning analysis ID.
+
+        Returns:
+            list[dict]: The SARIF 'runs' of the analysis, trimmed to the sections
+                        the parser reads, or an empty list on failure.
+        """
+        cached_runs = self._load_cached_sarif(analysis_id)
+        if cached_runs is not None:
+            return cached_runs
+
+        sarif_url = f"{self.analyses_url}/{analysis_id}"
+        response = self._session.get(sarif_url, headers={"Accept": "application/sarif+json"})
+        if response.status_code == 200:
+            runs = [_trim_sarif_run(run) for run in orjson.loads(response.content).get("runs", [])]
+            self._store_cached_sarif(analysis_id, runs)
+            return runs
+        log.warning("Failed to fetch SARIF data for category %s: %s", category, response.status_code)
+        return []
+
+    def _sarif_cache_path(self, analysis_id: int) -> str | None:
+        """Return the on-disk SARIF cache file for an analysis, or None if caching is disabled."""
+        if not self._cache_dir:
+            return None
+        return os.path.join(self._cache_dir, f"sarif-{self.owner}-{self.repo}-{analysis_id}.json.gz")
+
+    def _load_cached_sarif(self, analysis_id: int) -> list[dict] | None:
+        """
+        Load the cached SARIF runs of an analysis.
+
+        An analysis is immutable once uploaded, so a cached copy keyed by its ID
+        never needs revalidation: unchanged scans skip the download entirely.
+
+        Returns:
+            list[dict] | None: The cached runs, or None on a cache miss.
+        """
+        path = self._sarif_cache_path(analysis_id)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, ValueError) as e:
+            log.warning("Ignoring unreadable SARIF cache %s: %s", path, e)
+            return None
+
+    def _store_cached_sarif(self, analysis_id: int, runs: list[dict]) -> None:
+        """Write the SARIF runs of an analysis to the on-disk cache, if enabled."""
+        path = self._sarif_cache_path(analysis_id)
+        if not path:
+            return
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with gzip.open(path, "wb") as f:
+                f.write(orjson.dumps(runs))
+        except OSError as e:
+            log.warning("Failed to cache SARIF for analysis %s: %s", analysis_id, e)
+
     def _get_default_branch(self) -> str:
         """
         Fetch the default branch of the repository.
@@ -157,11 +489,10 @@ class GitHubClient:
             str: The name of the default branch.
         """
         url = f"https://api.github.com/repos/{self.owner}/{self.repo}"
-        headers = {"Accept": "application/vnd.github+json", "Authorization": f"Bearer {self.token}"}
-        response = requests.get(url, headers=headers)
+        response = self._session.get(url)
         if response.status_code == 200:
-            return response.json().get("default_branch")
+            return orjson.loads(response.content).get("default_branch")
         else:
-            print(f"Failed to fetch repository info: {response.status_code}")
+            log.warning("Failed to fetch repository info: %s", response.status_code)
             raise ValueError("Could not determine default branch")
         
\ No newline at end of file
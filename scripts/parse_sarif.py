@@ -26,7 +26,10 @@ This parser handles SARIF files from different CodeQL versions by:
 - Handling variations in property naming conventions across versions
 """
 
-from typing import Any
+import logging
+from typing import Any, Iterable
+
+log = logging.getLogger(__name__)
 
 
 def _extract_physical_location(location: dict[str, Any]) -> dict[str, Any] | None:
@@ -277,7 +280,7 @@ def _normalize_path(path: str | None) -> str:
 
 
 def build_active_alert_index(
-    alerts: list[dict[str, Any]]
+    alerts: Iterable[dict[str, Any]]
 ) -> dict[tuple[str, str, int], int]:
     """
     Build an index mapping (rule_id, file, line) to alert_number.
@@ -288,7 +291,8 @@ def build_active_alert_index(
     each vulnerability location.
 
     Args:
-        alerts: List of alerts from GitHubClient.get_active_alerts(). Each alert
+        alerts: Alerts from GitHubClient.get_active_alerts(), or the lazy stream
+                from GitHubClient.iter_active_alerts() (consumed once). Each alert
                 should contain 'number', 'rule.id', and 'most_recent_instance.location'.
 
     Returns:
@@ -374,11 +378,17 @@ def minify_sarif_state_aware(
 
     rules_map = _build_rules_map(runs)
 
+    # Rules with at least one active alert; results for any other rule are
+    # dropped before their locations are extracted or normalized.
+    active_rule_ids = {rule_id for rule_id, _, _ in active_alert_index}
+
     for run in runs:
         results = run.get("results", [])
 
         for result in results:
             rule_id = result.get("ruleId")
+            if rule_id not in active_rule_ids:
+                continue
 
             target = None
             locations = result.get("locations", [])
@@ -601,13 +611,13 @@ def run_state_aware_parse(sarif_data: dict[str, Any], alerts: list[dict[str, Any
     alert_index = build_active_alert_index(alerts)
     minified = minify_sarif_state_aware(sarif_data, alert_index)
     if not minified:
-        print(f"Minified to {len(minified)} results matching active alerts")
-        print("Probable error")
+        log.warning("Minified to %s results matching active alerts", len(minified))
+        log.warning("Probable error")
         return {}
     batches = get_remediation_batches_state_aware(minified)
     if not batches:
-        print(f"Created {len(batches)} remediation batches")
-        print("Probable error")
+        log.warning("Created %s remediation batches", len(batches))
+        log.warning("Probable error")
     return batches
     
     
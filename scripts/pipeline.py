@@ -0,0 +1,312 @@
+"""
+Shared Remediation Pipeline for Security Sentinel.
+
+This module holds the end-to-end workflow shared by every command-line entry
+point: validating the environment, fetching alerts and SARIF data, creating
+remediation batches, and dispatching them to the Devin AI orchestrator.
+
+Entry points stay thin wrappers around run(), so the GitHub client (with its
+pooled HTTP session and ETag/SARIF caches) is constructed in one place and
+closed when the run ends, persisting its caches for the next run.
+
+Example:
+    >>> from scripts.pipeline import parse_argv, run
+    >>> sys.exit(run(*parse_argv()))
+"""
+
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from scripts.github_client import GitHubClient
+from scripts.parse_sarif import run_state_aware_parse
+from scripts.devin_orchestrator import run_orchestrator
+from scripts.devin.DO_config import get_run_id
+from scripts.sentinel_logging import configure_logging
+
+log = logging.getLogger(__name__)
+
+_outputs: dict[str, str] = {}
+
+# GitHub clients of the current run, keyed by get_client() arguments
+_clients: dict[tuple[str, str, str | None, str | None], GitHubClient] = {}
+
+# Whether the step summary table of the current run already has its header
+_summary_started = False
+
+# Human-readable labels for the job summary table, keyed by output name
+_OUTPUT_LABELS = {
+    "alerts_found": "Active alerts found",
+    "batches_created": "Remediation batches created",
+    "status": "Status",
+}
+
+
+def set_output(name: str, value: str) -> None:
+    """
+    Record an output variable for the GitHub Actions output file.
+
+    Outputs are buffered in memory until run() flushes them: once before
+    the batches are dispatched, so the alert and batch counts survive a
+    cancelled orchestrator run, and once when run() returns. Setting the
+    same name twice before a flush keeps the latest value.
+
+    Args:
+        name: The output variable name.
+        value: The output variable value.
+    """
+    _outputs[name] = str(value)
+
+
+def _append_file(path: str, text: str) -> None:
+    """Append text to a file with a single write call."""
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, text.encode())
+    finally:
+        os.close(fd)
+
+
+def _flush_outputs(final: bool = False) -> None:
+    """
+    Write the buffered outputs to GITHUB_OUTPUT and GITHUB_STEP_SUMMARY.
+
+    Each file receives a single append per call, and the buffer is cleared
+    afterwards so a later run in the same process starts empty. The first
+    flush of a run writes the step summary table header; later flushes
+    append rows to the same table. Files whose environment variable is
+    unset are skipped.
+
+    Args:
+        final: Whether this is the last flush of the run, which closes the
+               step summary table.
+    """
+    global _summary_started
+
+    if _outputs:
+        github_output = os.getenv("GITHUB_OUTPUT")
+        if github_output:
+            _append_file(github_output, "".join(f"{name}={value}\n" for name, value in _outputs.items()))
+
+        step_summary = os.getenv("GITHUB_STEP_SUMMARY")
+        if step_summary:
+            header = "" if _summary_started else "### Security Sentinel\n\n| | |\n|---|---|\n"
+            rows = "".join(
+                f"| {_OUTPUT_LABELS.get(name, name)} | `{value}` |\n"
+                for name, value in _outputs.items()
+            )
+            _append_file(step_summary, header + rows + ("\n" if final else ""))
+            _summary_started = True
+
+        _outputs.clear()
+
+    if final:
+        _summary_started = False
+
+
+def get_client(owner: str, repo: str, branch: str | None = None, token: str | None = None) -> GitHubClient:
+    """
+    Return a GitHubClient for the repository, reusing one per argument set.
+
+    Every caller within a run shares the client's requests.Session and its
+    ETag and SARIF caches instead of reconnecting and re-downloading. The
+    clients are kept until close_clients() closes them at the end of run().
+
+    Args:
+        owner: GitHub repository owner.
+        repo: GitHub repository name.
+        branch: Branch to scan (default: the repository's default branch).
+        token: GitHub token (default: GH_TOKEN from the environment).
+
+    Returns:
+        The shared GitHubClient instance.
+    """
+    key = (owner, repo, branch, token)
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = GitHubClient(owner, repo, token=token, branch=branch)
+    return client
+
+
+def close_clients() -> None:
+    """
+    Close every client handed out by get_client().
+
+    Closing persists each client's pending ETag cache changes to disk, so
+    the next run (in this process or a later one) still sends conditional
+    requests, and releases its pooled connections.
+    """
+    while _clients:
+        _, client = _clients.popitem()
+        client.close()
+
+
+def _fetch_alerts_and_sarif(client: GitHubClient) -> tuple[list[dict], dict]:
+    """
+    Download the active alerts and, if there are any, the SARIF data.
+
+    The SARIF download only starts once the first alert page shows there is
+    work to do, so a run without open alerts never pays for it. It then runs
+    on a helper thread while the remaining alert pages are read.
+
+    Args:
+        client: The GitHub client of the repository.
+
+    Returns:
+        Tuple of (alerts, sarif_data). Both are empty if there are no active
+        alerts or the alert request fails.
+    """
+    alert_iter = client.iter_active_alerts()
+    try:
+        first_alert = next(alert_iter, None)
+        if first_alert is None:
+            return [], {}
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sarif_future = executor.submit(client.get_sarif_data)
+            alerts = [first_alert, *alert_iter]
+            return alerts, sarif_future.result()
+    except requests.HTTPError as e:
+        log.warning("Failed to fetch code scanning alerts: %s", e)
+        return [], {}
+
+
+def parse_argv(argv: list[str] | None = None) -> tuple[str, str, str | None, int, str | None]:
+    """
+    Parse the command-line arguments shared by all entry points.
+
+    Prints usage and exits with status 1 if owner or repo is missing.
+
+    Args:
+        argv: Argument list (default: sys.argv).
+
+    Returns:
+        Tuple of (owner, repo, branch, max_workers, slack_channel_id) in the
+        positional order accepted by run().
+    """
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 3:
+        print(f"Usage: python {os.path.basename(argv[0])} <owner> <repo> [<branch>] [<slack_channel_id>]")
+        print("\nThis script requires the following environment variables:")
+        print("  GH_TOKEN - GitHub Personal Access Token")
+        print("  DEVIN_API_KEY - Devin AI API Key")
+        print("\nOptional environment variables for Slack integration:")
+        print("  SLACK_BOT_TOKEN - Slack Bot OAuth Token")
+        print("  SLACK_CHANNEL_ID - Slack Channel ID (can also be passed as 4th argument)")
+        sys.exit(1)
+
+    owner = argv[1]
+    repo = argv[2]
+    branch = argv[3].strip() or None if len(argv) > 3 else None
+    slack_channel_id = argv[4].strip() or None if len(argv) > 4 else None
+    return owner, repo, branch, 4, slack_channel_id
+
+
+def run(
+    owner: str,
+    repo: str,
+    branch: str | None = None,
+    max_workers: int = 4,
+    slack_channel_id: str | None = None
+) -> int:
+    """
+    Run the full Security Sentinel workflow for one repository.
+
+    Validates environment variables, fetches security alerts and SARIF data,
+    creates remediation batches, and dispatches them to the Devin AI
+    orchestrator. Progress is reported through GitHub Actions outputs, which
+    are written before the batches are dispatched and when the run ends.
+
+    The SARIF data is fetched on a helper thread while the alert pages are
+    read, but only once at least one active alert has been found.
+
+    Args:
+        owner: GitHub repository owner.
+        repo: GitHub repository name.
+        branch: Branch to scan (default: the repository's default branch).
+        max_workers: Maximum concurrent batch worker threads (default: 4).
+        slack_channel_id: Slack channel for dashboard updates (default:
+                          SLACK_CHANNEL_ID from the environment).
+
+    Returns:
+        Exit code (0 for success or no alerts, 1 for errors).
+    """
+    try:
+        return _run(owner, repo, branch, max_workers, slack_channel_id)
+    finally:
+        close_clients()
+        _flush_outputs(final=True)
+
+
+def _run(
+    owner: str,
+    repo: str,
+    branch: str | None,
+    max_workers: int,
+    slack_channel_id: str | None
+) -> int:
+    """Run the workflow behind run(); outputs are flushed by the caller."""
+    GH_TOKEN = os.getenv("GH_TOKEN")
+    DEVIN_API_KEY = os.getenv("DEVIN_API_KEY")
+    SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
+    SLACK_CHANNEL_ID = slack_channel_id or os.getenv("SLACK_CHANNEL_ID")
+
+    if not GH_TOKEN:
+        print("::error::Missing GH_TOKEN environment variable")
+        return 1
+
+    if not DEVIN_API_KEY:
+        print("::error::Missing DEVIN_API_KEY environment variable")
+        return 1
+
+    configure_logging()
+
+    if SLACK_BOT_TOKEN and SLACK_CHANNEL_ID:
+        log.info("Slack integration enabled - dashboard updates will be sent to Slack")
+    else:
+        log.info("Slack integration disabled - using terminal output only")
+
+    start = time.time()
+
+    client = get_client(owner, repo, branch, GH_TOKEN)
+    alerts, sarif_data = _fetch_alerts_and_sarif(client)
+    if not alerts:
+        log.info("No active unassigned alerts found.")
+        set_output("alerts_found", "0")
+        set_output("batches_created", "0")
+        set_output("status", "no_alerts")
+        return 0
+    log.info("Found %s active alerts", len(alerts))
+    set_output("alerts_found", str(len(alerts)))
+
+    if not sarif_data:
+        log.error("Failed to fetch SARIF data.")
+        set_output("batches_created", "0")
+        set_output("status", "failed")
+        return 1
+
+    batches = run_state_aware_parse(sarif_data, alerts)
+    if not batches:
+        log.info("No remediation batches created.")
+        set_output("batches_created", "0")
+        set_output("status", "no_alerts")
+        return 0
+
+    log.info("Created %s remediation batches", len(batches))
+    set_output("batches_created", str(len(batches)))
+    _flush_outputs()
+    run_orchestrator(
+        batches,
+        owner=owner,
+        repo=repo,
+        max_workers=max_workers,
+        slack_channel_id=SLACK_CHANNEL_ID,
+        run_id=get_run_id()
+    )
+    end = time.time()
+    log.info("Total execution time: %.2f seconds", end - start)
+    set_output("status", "success")
+    return 0
@@ -0,0 +1,52 @@
+"""
+Logging Setup for Security Sentinel.
+
+This module configures process-wide logging for the Security Sentinel entry
+points. Worker threads only enqueue log records; a single background listener
+thread formats them and writes to stdout, so concurrent batches never contend
+on the stdout lock.
+
+Modules obtain their logger with ``logging.getLogger(__name__)`` and never
+configure handlers themselves; only entry points call configure_logging().
+
+Example:
+    >>> from scripts.sentinel_logging import configure_logging
+    >>> configure_logging()
+    >>> logging.getLogger(__name__).info("[Main] Starting")
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Route all log records through a queue to a single stdout writer thread.
+
+    Messages are emitted without any prefix so output matches the plain
+    ``print`` lines used elsewhere (GitHub Actions workflow commands such as
+    ``::error::`` keep working). Calling this more than once is a no-op.
+
+    Args:
+        level: Minimum level for the root logger (default: INFO).
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
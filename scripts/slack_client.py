@@ -9,7 +9,7 @@ The dashboard operates in two modes:
 1. Slack Mode: When SLACK_BOT_TOKEN and SLACK_CHANNEL_ID are configured, updates
    are posted to Slack with live-updating messages.
 2. Terminal Fallback: When Slack credentials are missing, status updates are
-   printed to the terminal instead.
+   logged to the terminal instead.
 
 Environment Variables:
     SLACK_BOT_TOKEN: Slack Bot OAuth Token for API authentication.
@@ -22,9 +22,11 @@ Example:
     >>> dashboard.finalize_report(results)
 """
 
+import logging
 import os
 import threading
 import time
+from collections import Counter
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -34,10 +36,42 @@ from slack_sdk.errors import SlackApiError
 if TYPE_CHECKING:
     from scripts.devin.DO_models import SessionResult
 
+log = logging.getLogger(__name__)
+
 DEVIN_SESSION_URL_BASE = "https://app.devin.ai/sessions"
 
+# Terminal summary icons keyed by SessionStatus name (the models are imported lazily)
+_STATUS_ICONS = {
+    "SUCCESS": "[OK]",
+    "FAILURE": "[FAIL]",
+    "PARTIAL": "[PARTIAL]",
+    "STUCK": "[STUCK]",
+    "TIMEOUT": "[TIMEOUT]"
+}
+
 
-@dataclass
+def _tally_results(results: "list[SessionResult]") -> tuple[Counter, int, int, int]:
+    """
+    Count results per status and sum their alert counts in a single pass.
+    
+    Args:
+        results: List of SessionResult objects from the orchestrator run.
+    
+    Returns:
+        Tuple of (Counter of results by SessionStatus, total alerts, fixed
+        alerts, unfixed alerts).
+    """
+    status_counts: Counter = Counter()
+    total_alerts = fixed_alerts = unfixed_alerts = 0
+    for r in results:
+        status_counts[r.status] += 1
+        total_alerts += len(r.alert_numbers)
+        fixed_alerts += len(r.fixed_alerts)
+        unfixed_alerts += len(r.unfixed_alerts)
+    return status_counts, total_alerts, fixed_alerts, unfixed_alerts
+
+
+@dataclass(slots=True)
 class BatchInfo:
     """
     Stores tracking information for each remediation batch.
@@ -50,6 +84,8 @@ class BatchInfo:
         session_id: Optional Devin session ID for URL construction fallback.
         session_url: Optional direct URL to the Devin session (preferred over session_id).
         pr_url: Optional URL to the pull request if a fix was created.
+    
+    Uses __slots__, so instances carry no per-instance __dict__.
     """
     status: str
     session_id: str | None = None
@@ -105,7 +141,7 @@ class SentinelDashboard:
         self.channel = channel_id or os.getenv("SLACK_CHANNEL_ID")
         
         if not token or not self.channel:
-            print("Slack credentials missing. Dashboard is disabled (Terminal Fallback Active).")
+            log.info("Slack credentials missing. Dashboard is disabled (Terminal Fallback Active).")
             self.enabled = False
             return
 
@@ -114,7 +150,7 @@ class SentinelDashboard:
             self.enabled = True
             self._ensure_access()
         except Exception as e:
-            print(f"Slack Initialization failed: {e}")
+            log.error("Slack Initialization failed: %s", e)
             self.enabled = False
 
     def _ensure_access(self) -> None:
@@ -123,14 +159,14 @@ class SentinelDashboard:
         
         This method tries to join the configured channel. If the bot is already
         a member or the channel is public, this succeeds silently. Warnings are
-        printed for permission issues but don't disable the dashboard.
+        logged for permission issues but don't disable the dashboard.
         """
         if not self.enabled:
             return
         try:
             self.client.conversations_join(channel=self.channel)
         except SlackApiError as e:
-            print(f"Slack join warning: {e.response['error']}")
+            log.warning("Slack join warning: %s", e.response['error'])
 
     def update(
         self,
@@ -153,7 +189,7 @@ class SentinelDashboard:
         display_status = self._format_status_with_emoji(status)
 
         if not self.enabled:
-            print(f"[Sentinel Log] {batch_name}: {display_status}")
+            log.info("[Sentinel Log] %s: %s", batch_name, display_status)
             return
 
         with self.lock:
@@ -250,15 +286,12 @@ class SentinelDashboard:
         duration = int((time.time() - self.start_time) / 60)
         
         total = len(results)
-        successes = sum(1 for r in results if r.status == SessionStatus.SUCCESS)
-        failures = sum(1 for r in results if r.status == SessionStatus.FAILURE)
-        partials = sum(1 for r in results if r.status == SessionStatus.PARTIAL)
-        stuck = sum(1 for r in results if r.status == SessionStatus.STUCK)
-        timeouts = sum(1 for r in results if r.status == SessionStatus.TIMEOUT)
-        
-        total_alerts = sum(len(r.alert_numbers) for r in results)
-        fixed_alerts = sum(len(r.fixed_alerts) for r in results)
-        unfixed_alerts = sum(len(r.unfixed_alerts) for r in results)
+        status_counts, total_alerts, fixed_alerts, unfixed_alerts = _tally_results(results)
+        successes = status_counts[SessionStatus.SUCCESS]
+        failures = status_counts[SessionStatus.FAILURE]
+        partials = status_counts[SessionStatus.PARTIAL]
+        stuck = status_counts[SessionStatus.STUCK]
+        timeouts = status_counts[SessionStatus.TIMEOUT]
         
         hours_saved = successes * 2
         
@@ -436,7 +469,7 @@ class SentinelDashboard:
                     "text": {"type": "mrkdwn", "text": link_text}
                 })
         
-        print("All batches processed. Sentinel Run Complete.")
+        log.info("All batches processed. Sentinel Run Complete.")
         
         if not self.enabled:
             return
@@ -450,6 +483,8 @@ class SentinelDashboard:
         
         This method mirrors the functionality of print_summary from DO_reporting,
         providing a consistent summary format regardless of whether Slack is enabled.
+        Like print_summary, the report is built in memory and logged as a single
+        record, so it is printed after every log line queued before it.
         
         Args:
             results: List of SessionResult objects from the orchestrator run.
@@ -457,51 +492,47 @@ class SentinelDashboard:
         from scripts.devin.DO_models import SessionStatus
         
         total = len(results)
-        successes = sum(1 for r in results if r.status == SessionStatus.SUCCESS)
-        failures = sum(1 for r in results if r.status == SessionStatus.FAILURE)
-        partials = sum(1 for r in results if r.status == SessionStatus.PARTIAL)
-        stuck = sum(1 for r in results if r.status == SessionStatus.STUCK)
-        timeouts = sum(1 for r in results if r.status == SessionStatus.TIMEOUT)
-        
-        total_alerts = sum(len(r.alert_numbers) for r in results)
-        fixed_alerts = sum(len(r.fixed_alerts) for r in results)
-        unfixed_alerts = sum(len(r.unfixed_alerts) for r in results)
-        
-        print("\n" + "=" * 60)
-        print("           SENTINEL RUN SUMMARY (Slack Dashboard)")
-        print("=" * 60)
-        print(f"\nBatch Statistics:")
-        print(f"  Total Batches:     {total}")
-        print(f"  Successes:         {successes}")
-        print(f"  Partial Successes: {partials}")
-        print(f"  Failures:          {failures}")
-        print(f"  Stuck Sessions:    {stuck}")
-        print(f"  Timeouts:          {timeouts}")
-        
-        print(f"\nAlert Statistics:")
-        print(f"  Total Alerts:      {total_alerts}")
-        print(f"  Fixed Alerts:      {fixed_alerts}")
-        print(f"  Unfixed Alerts:    {unfixed_alerts}")
-        
-        print(f"\nDetailed Results:")
+        status_counts, total_alerts, fixed_alerts, unfixed_alerts = _tally_results(results)
+        successes = status_counts[SessionStatus.SUCCESS]
+        failures = status_counts[SessionStatus.FAILURE]
+        partials = status_counts[SessionStatus.PARTIAL]
+        stuck = status_counts[SessionStatus.STUCK]
+        timeouts = status_counts[SessionStatus.TIMEOUT]
+        
+        lines: list[str] = []
+        add = lines.append
+        
+        add("=" * 60)
+        add("           SENTINEL RUN SUMMARY (Slack Dashboard)")
+        add("=" * 60)
+        add(f"\nBatch Statistics:")
+        add(f"  Total Batches:     {total}")
+        add(f"  Successes:         {successes}")
+        add(f"  Partial Successes: {partials}")
+        add(f"  Failures:          {failures}")
+        add(f"  Stuck Sessions:    {stuck}")
+        add(f"  Timeouts:          {timeouts}")
+        
+        add(f"\nAlert Statistics:")
+        add(f"  Total Alerts:      {total_alerts}")
+        add(f"  Fixed Alerts:      {fixed_alerts}")
+        add(f"  Unfixed Alerts:    {unfixed_alerts}")
+        
+        add(f"\nDetailed Results:")
         for r in results:
-            status_icon = {
-                SessionStatus.SUCCESS: "[OK]",
-                SessionStatus.FAILURE: "[FAIL]",
-                SessionStatus.PARTIAL: "[PARTIAL]",
-                SessionStatus.STUCK: "[STUCK]",
-                SessionStatus.TIMEOUT: "[TIMEOUT]"
-            }.get(r.status, "[?]")
+            status_icon = _STATUS_ICONS.get(r.status.name, "[?]")
             
-            print(f"  {status_icon} {r.batch_id}")
+            add(f"  {status_icon} {r.batch_id}")
             if r.pr_url:
-                print(f"       PR: {r.pr_url}")
+                add(f"       PR: {r.pr_url}")
             elif r.session_url:
-                print(f"       Devin: {r.session_url}")
+                add(f"       Devin: {r.session_url}")
             elif r.session_id:
-                print(f"       Devin: {DEVIN_SESSION_URL_BASE}/{r.session_id}")
+                add(f"       Devin: {DEVIN_SESSION_URL_BASE}/{r.session_id}")
+        
+        add("\n" + "=" * 60)
         
-        print("\n" + "=" * 60)
+        log.info("\n".join(lines))
 
     def _transmit(self, blocks: list) -> None:
         """
@@ -521,5 +552,5 @@ class SentinelDashboard:
             else:
                 self.client.chat_update(channel=self.channel, ts=self.msg_ts, blocks=blocks)
         except SlackApiError as e:
-            print(f"Slack API Error: {e.response['error']}")
+            log.error("Slack API Error: %s", e.response['error'])
             self.enabled = False # Disable UI to prevent log spam if token/channel fails
@@ -17,15 +17,24 @@ Key Functions:
 - get_available_session_slots: Calculate available slots without terminating
 """
 
-import os
-import time
+import atexit
+import logging
 from typing import Any
 
+import orjson
 import requests
+from urllib3.util.retry import Retry
 
+from scripts.devin.DO_config import (
+    DEVIN_API_BASE,
+    DEVIN_RETRY_ATTEMPTS,
+    DEVIN_RETRY_BACKOFF_SECONDS,
+    MAX_ACTIVE_SESSIONS,
+    POLL_JITTER_SECONDS,
+)
+from scripts.devin.DO_http import DevinAuth, create_pooled_session
 
-DEVIN_API_BASE = "https://api.devin.ai/v1"
-MAX_ACTIVE_SESSIONS = 5
+log = logging.getLogger(__name__)
 
 SENTINEL_SESSION_MARKERS = [
     "<security_remediation_task>",
@@ -34,12 +43,41 @@ SENTINEL_SESSION_MARKERS = [
 ]
 
 
-def _get_devin_api_key() -> str:
-    """Get the Devin API key from environment variables."""
-    key = os.getenv("DEVIN_API_KEY")
-    if not key:
-        raise ValueError("DEVIN_API_KEY environment variable is not set")
-    return key
+def _create_http_session() -> requests.Session:
+    """
+    Create the pooled HTTP session shared by all Devin API calls in this module.
+    
+    Every batch worker sends a sleep message when its session ends, and the
+    cleanup helpers loop over many sessions; reusing keep-alive connections
+    means only the first of these calls pays for the TCP and TLS handshake.
+    
+    The session is built by DO_http.create_pooled_session, like the one in
+    DO_session, and shares its cached Devin auth. The adapter retries
+    rate-limit (429) and 5xx responses and connection errors on GET and
+    DELETE (terminations are idempotent) with jittered exponential backoff,
+    waiting for Retry-After when the API sends it. POST is not retried:
+    a sleep message carries no idempotency key, so a retry after the
+    server accepted it would post the message twice. This is the only
+    pacing: the cleanup loops send their requests back to back and wait
+    only when the API pushes back.
+    
+    Returns:
+        A configured requests.Session
+    """
+    retry = Retry(
+        total=DEVIN_RETRY_ATTEMPTS,
+        backoff_factor=DEVIN_RETRY_BACKOFF_SECONDS,
+        backoff_jitter=POLL_JITTER_SECONDS,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "DELETE"),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    return create_pooled_session(headers={"Content-Type": "application/json"}, auth=DevinAuth(), max_retries=retry)
+
+
+_http_session = _create_http_session()
+atexit.register(_http_session.close)
 
 
 def send_sleep_message(
@@ -60,30 +98,24 @@ def send_sleep_message(
     Returns:
         True if the message was sent successfully, False otherwise
     """
-    api_key = _get_devin_api_key()
     url = f"{DEVIN_API_BASE}/sessions/{session_id}/message"
     
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    
     payload = {
         "message": message
     }
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = _http_session.post(url, data=orjson.dumps(payload), timeout=30)
         
         if response.status_code == 200:
-            print(f"[Sleep] Sent sleep message to session {session_id}")
+            log.info("[Sleep] Sent sleep message to session %s", session_id)
             return True
         else:
-            print(f"[Sleep] Failed to send message to session {session_id}: {response.status_code}")
+            log.warning("[Sleep] Failed to send message to session %s: %s", session_id, response.status_code)
             return False
     
     except requests.RequestException as e:
-        print(f"[Sleep] Error sending message to session {session_id}: {e}")
+        log.error("[Sleep] Error sending message to session %s: %s", session_id, e)
         return False
 
 
@@ -101,26 +133,20 @@ def terminate_devin_session(session_id: str) -> bool:
     Returns:
         True if termination was successful, False otherwise
     """
-    api_key = _get_devin_api_key()
     url = f"{DEVIN_API_BASE}/sessions/{session_id}"
     
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    
     try:
-        response = requests.delete(url, headers=headers, timeout=30)
+        response = _http_session.delete(url, timeout=30)
         
         if response.status_code == 200:
-            print(f"[Terminate] Session {session_id} terminated successfully")
+            log.info("[Terminate] Session %s terminated successfully", session_id)
             return True
         else:
-            print(f"[Terminate] Failed to terminate session {session_id}: {response.status_code}")
+            log.warning("[Terminate] Failed to terminate session %s: %s", session_id, response.status_code)
             return False
     
     except requests.RequestException as e:
-        print(f"[Terminate] Error terminating session {session_id}: {e}")
+        log.error("[Terminate] Error terminating session %s: %s", session_id, e)
         return False
 
 
@@ -134,29 +160,23 @@ def list_devin_sessions(limit: int = 100) -> list[dict[str, Any]]:
     Returns:
         List of session dictionaries, or empty list on failure
     """
-    api_key = _get_devin_api_key()
     url = f"{DEVIN_API_BASE}/sessions"
     
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    
     params = {"limit": limit}
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _http_session.get(url, params=params, timeout=30)
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             sessions = data.get("sessions", [])
             return sessions
         else:
-            print(f"[Sessions] Failed to list sessions: {response.status_code}")
+            log.warning("[Sessions] Failed to list sessions: %s", response.status_code)
             return []
     
-    except requests.RequestException as e:
-        print(f"[Sessions] Error listing sessions: {e}")
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        log.error("[Sessions] Error listing sessions: %s", e)
         return []
 
 
@@ -219,7 +239,7 @@ def get_available_session_slots() -> int:
     active_count = get_active_session_count()
     available = max(0, MAX_ACTIVE_SESSIONS - active_count)
     
-    print(f"[Capacity] Active sessions: {active_count}/{MAX_ACTIVE_SESSIONS}, Available slots: {available}")
+    log.info("[Capacity] Active sessions: %s/%s, Available slots: %s", active_count, MAX_ACTIVE_SESSIONS, available)
     return available
 
 
@@ -237,6 +257,42 @@ def can_open_sessions(count: int) -> bool:
     return available >= count
 
 
+def _cleanup_sessions(sessions: list[dict[str, Any]], use_sleep: bool, kind: str) -> int:
+    """
+    Send a sleep message to, or terminate, each of the given sessions.
+    
+    Shared by the cleanup functions, which differ only in how they select
+    sessions.
+    
+    Args:
+        sessions: Session dictionaries from list_devin_sessions()
+        use_sleep: If True, send sleep messages instead of terminating
+        kind: Description of the sessions for the summary log line
+    
+    Returns:
+        Number of sessions cleaned up
+    """
+    cleaned_count = 0
+    for session in sessions:
+        session_id = session.get("session_id", "")
+        status = session.get("status_enum", session.get("status", "unknown"))
+        
+        if not session_id:
+            continue
+        
+        if use_sleep:
+            if send_sleep_message(session_id):
+                cleaned_count += 1
+                log.info("[Cleanup] Sent sleep message to session %s (was: %s)", session_id, status)
+        else:
+            if terminate_devin_session(session_id):
+                cleaned_count += 1
+                log.info("[Cleanup] Terminated session %s (was: %s)", session_id, status)
+    
+    log.info("[Cleanup] Cleaned up %s %s sessions", cleaned_count, kind)
+    return cleaned_count
+
+
 def cleanup_sentinel_sessions(
     use_sleep: bool = True,
     only_inactive: bool = True
@@ -260,7 +316,7 @@ def cleanup_sentinel_sessions(
     sessions = list_devin_sessions()
     
     if not sessions:
-        print("[Cleanup] No sessions found")
+        log.info("[Cleanup] No sessions found")
         return 0
     
     active_statuses = {"working", "running", "pending"}
@@ -268,10 +324,10 @@ def cleanup_sentinel_sessions(
     sentinel_sessions = [s for s in sessions if is_sentinel_session(s)]
     
     if not sentinel_sessions:
-        print("[Cleanup] No sentinel sessions found")
+        log.info("[Cleanup] No sentinel sessions found")
         return 0
     
-    print(f"[Cleanup] Found {len(sentinel_sessions)} sentinel sessions")
+    log.info("[Cleanup] Found %s sentinel sessions", len(sentinel_sessions))
     
     if only_inactive:
         target_sessions = [
@@ -282,32 +338,12 @@ def cleanup_sentinel_sessions(
         target_sessions = sentinel_sessions
     
     if not target_sessions:
-        print("[Cleanup] No target sessions to clean up")
+        log.info("[Cleanup] No target sessions to clean up")
         return 0
     
-    print(f"[Cleanup] Cleaning up {len(target_sessions)} sessions (use_sleep={use_sleep})")
-    
-    cleaned_count = 0
-    for session in target_sessions:
-        session_id = session.get("session_id", "")
-        status = session.get("status_enum", session.get("status", "unknown"))
-        
-        if not session_id:
-            continue
-        
-        if use_sleep:
-            if send_sleep_message(session_id):
-                cleaned_count += 1
-                print(f"[Cleanup] Sent sleep message to session {session_id} (was: {status})")
-        else:
-            if terminate_devin_session(session_id):
-                cleaned_count += 1
-                print(f"[Cleanup] Terminated session {session_id} (was: {status})")
-        
-        time.sleep(0.5)
+    log.info("[Cleanup] Cleaning up %s sessions (use_sleep=%s)", len(target_sessions), use_sleep)
     
-    print(f"[Cleanup] Cleaned up {cleaned_count} sentinel sessions")
-    return cleaned_count
+    return _cleanup_sessions(target_sessions, use_sleep, "sentinel")
 
 
 def cleanup_inactive_sessions(use_sleep: bool = True) -> int:
@@ -329,7 +365,7 @@ def cleanup_inactive_sessions(use_sleep: bool = True) -> int:
     sessions = list_devin_sessions()
     
     if not sessions:
-        print("[Cleanup] No sessions found")
+        log.info("[Cleanup] No sessions found")
         return 0
     
     active_statuses = {"working", "running", "pending"}
@@ -339,29 +375,9 @@ def cleanup_inactive_sessions(use_sleep: bool = True) -> int:
     ]
     
     if not inactive_sessions:
-        print("[Cleanup] No inactive sessions to clean up")
+        log.info("[Cleanup] No inactive sessions to clean up")
         return 0
     
-    print(f"[Cleanup] Found {len(inactive_sessions)} inactive sessions to clean up")
+    log.info("[Cleanup] Found %s inactive sessions to clean up", len(inactive_sessions))
     
-    cleaned_count = 0
-    for session in inactive_sessions:
-        session_id = session.get("session_id", "")
-        status = session.get("status_enum", session.get("status", "unknown"))
-        
-        if not session_id:
-            continue
-        
-        if use_sleep:
-            if send_sleep_message(session_id):
-                cleaned_count += 1
-                print(f"[Cleanup] Sent sleep message to session {session_id} (was: {status})")
-        else:
-            if terminate_devin_session(session_id):
-                cleaned_count += 1
-                print(f"[Cleanup] Terminated session {session_id} (was: {status})")
-        
-        time.sleep(0.5)
-    
-    print(f"[Cleanup] Cleaned up {cleaned_count} inactive sessions")
-    return cleaned_count
+    return _cleanup_sessions(inactive_sessions, use_sleep, "inactive")
@@ -0,0 +1,134 @@
+"""
+Unit tests for batch dispatching.
+
+These tests verify that dispatch_threads() hands batches to its workers in
+descending severity order from a shared queue, sizes the worker pool,
+collects one result per batch, and re-arms polling that an earlier
+interrupted dispatch cancelled. process_batch() is mocked, so no sessions
+are created.
+"""
+
+import os
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.devin import DO_session
+from scripts.devin.DO_batch_processor import dispatch_threads
+from scripts.devin.DO_models import SessionResult, SessionStatus
+
+MODULE = 'scripts.devin.DO_batch_processor'
+
+
+def _batch(severity, *alert_numbers):
+    return {"severity": severity, "tasks": [{"alert_number": n} for n in alert_numbers]}
+
+
+class TestDispatchThreads(unittest.TestCase):
+    """Test dispatch_threads queueing and result collection."""
+
+    def setUp(self):
+        self.calls = []
+        self.lock = threading.Lock()
+        patcher = patch(f'{MODULE}.process_batch', side_effect=self._process_batch)
+        self.mock_process = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _process_batch(self, batch_id, batch_data, alert_numbers, owner, repo, state,
+                       session_semaphore, dashboard, run_id, prompt):
+        with self.lock:
+            self.calls.append((batch_id, alert_numbers, prompt))
+        return SessionResult(
+            status=SessionStatus.SUCCESS,
+            session_id=f"session-{batch_id}",
+            batch_id=batch_id,
+            alert_numbers=alert_numbers
+        )
+
+    def test_empty_batches_return_no_results(self):
+        """Verify nothing is dispatched when there are no batches."""
+        self.assertEqual(dispatch_threads({}, 'owner', 'repo'), [])
+        self.mock_process.assert_not_called()
+
+    def test_batches_are_taken_by_descending_severity(self):
+        """Verify a single worker takes the most severe batch first and unrated ones last."""
+        batches = {
+            'low': _batch(3.1, 1),
+            'unrated': _batch(None, 2),
+            'critical': _batch(9.8, 3),
+            'high': _batch(7.5, 4),
+        }
+
+        dispatch_threads(batches, 'owner', 'repo', max_workers=1, available_session_slots=1, run_id='run')
+
+        self.assertEqual([batch_id for batch_id, _, _ in self.calls], ['critical', 'high', 'low', 'unrated'])
+
+    def test_every_batch_gets_one_result(self):
+        """Verify each batch is processed once with its alert numbers and prebuilt prompt."""
+        batches = {f'b{i}': _batch(float(i), i, i + 100) for i in range(6)}
+        prompts = {'b2': 'prompt for b2'}
+
+        results = dispatch_threads(batches, 'owner', 'repo', max_workers=3, available_session_slots=3, run_id='run', prompts=prompts)
+
+        self.assertEqual(sorted(r.batch_id for r in results), sorted(batches))
+        calls = {batch_id: (alerts, prompt) for batch_id, alerts, prompt in self.calls}
+        self.assertEqual(len(self.calls), 6)
+        self.assertEqual(calls['b2'], ([2, 102], 'prompt for b2'))
+        self.assertEqual(calls['b4'], ([4, 104], None))
+
+    def test_worker_count_follows_slots_and_batch_count(self):
+        """Verify the pool is raised to the session slots and capped at the batch count."""
+        batches = {f'b{i}': _batch(1.0, i) for i in range(3)}
+
+        with patch(f'{MODULE}.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            dispatch_threads(batches, 'owner', 'repo', max_workers=1, available_session_slots=2, run_id='run')
+            dispatch_threads(batches, 'owner', 'repo', max_workers=8, available_session_slots=5, run_id='run')
+
+        worker_counts = [call.kwargs['max_workers'] for call in mock_executor.call_args_list]
+        self.assertEqual(worker_counts, [2, 3])
+
+    def test_failed_batch_does_not_stop_the_rest(self):
+        """Verify an exception in one batch becomes a FAILURE result and other batches still run."""
+        def process(batch_id, *args):
+            if batch_id == 'bad':
+                raise RuntimeError('session creation failed')
+            return self._process_batch(batch_id, *args)
+        self.mock_process.side_effect = process
+        batches = {'bad': _batch(9.0, 1), 'good': _batch(5.0, 2)}
+
+        results = {r.batch_id: r for r in dispatch_threads(batches, 'owner', 'repo', max_workers=1, available_session_slots=1, run_id='run')}
+
+        self.assertEqual(results['bad'].status, SessionStatus.FAILURE)
+        self.assertEqual(results['bad'].error_message, 'session creation failed')
+        self.assertEqual(results['good'].status, SessionStatus.SUCCESS)
+
+    def test_interrupt_stops_queue_and_cancels_polling(self):
+        """Verify an interrupt stops pending batches from being taken and wakes pollers."""
+        self.mock_process.side_effect = KeyboardInterrupt
+        batches = {'first': _batch(9.0, 1), 'second': _batch(5.0, 2)}
+
+        with patch(f'{MODULE}.cancel_polling') as mock_cancel:
+            with self.assertRaises(KeyboardInterrupt):
+                dispatch_threads(batches, 'owner', 'repo', max_workers=1, available_session_slots=1, run_id='run')
+
+        mock_cancel.assert_called_once()
+        self.assertEqual(self.mock_process.call_count, 1)
+
+    def test_dispatch_rearms_polling_after_cancel(self):
+        """Verify a dispatch after an interrupted one does not start with polling cancelled."""
+        self.addCleanup(DO_session._polling_cancelled.clear)
+        DO_session.cancel_polling()
+        seen = []
+        self.mock_process.side_effect = lambda *args: seen.append(DO_session._polling_cancelled.is_set()) or self._process_batch(*args)
+
+        dispatch_threads({'b1': _batch(1.0, 1)}, 'owner', 'repo', max_workers=1, available_session_slots=1, run_id='run')
+
+        self.assertEqual(seen, [False])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+"""
+Unit tests for the GitHub alert control center.
+
+These tests cover the token pool that paces alert updates across several
+GitHub tokens and the concurrent alert update helpers, without making any
+real API calls.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+
+import orjson
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.devin import DO_gh_alerts_control_center as control_center
+from scripts.devin.DO_config import TOKEN_MIN_REMAINING, RATE_LIMIT_MAX_WAIT_SECONDS
+
+MODULE = 'scripts.devin.DO_gh_alerts_control_center'
+
+
+def _response(status_code=200, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestGitHubTokenPool(unittest.TestCase):
+    """Test _GitHubTokenPool rotation and rate-limit resting."""
+
+    def setUp(self):
+        patcher = patch(f'{MODULE}.time')
+        self.mock_time = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_time.time.return_value = 1000.0
+        self.pool = control_center._GitHubTokenPool(['a', 'b', 'c'])
+
+    def test_tokens_rotate_round_robin(self):
+        """Verify acquire() cycles through every token in order."""
+        tokens = [self.pool.acquire() for _ in range(4)]
+
+        self.assertEqual(tokens, ['a', 'b', 'c', 'a'])
+        self.mock_time.sleep.assert_not_called()
+
+    def test_secondary_rate_limit_rests_token(self):
+        """Verify a token answered with Retry-After is skipped until it recovers."""
+        self.pool.record('a', _response(403, {'Retry-After': '30'}))
+
+        self.assertEqual([self.pool.acquire() for _ in range(3)], ['b', 'c', 'b'])
+
+        self.mock_time.time.return_value = 1031.0
+        self.assertIn('a', [self.pool.acquire() for _ in range(3)])
+
+    def test_low_remaining_rests_until_reset(self):
+        """Verify a nearly spent token rests until its X-RateLimit-Reset time."""
+        headers = {'X-RateLimit-Remaining': str(TOKEN_MIN_REMAINING - 1), 'X-RateLimit-Reset': '1500'}
+        self.pool.record('b', _response(200, headers))
+
+        self.assertEqual([self.pool.acquire() for _ in range(3)], ['a', 'c', 'a'])
+
+    def test_healthy_response_does_not_rest_token(self):
+        """Verify a token with enough remaining budget stays in rotation."""
+        headers = {'X-RateLimit-Remaining': str(TOKEN_MIN_REMAINING), 'X-RateLimit-Reset': '1500'}
+        self.pool.record('a', _response(200, headers))
+
+        self.assertEqual([self.pool.acquire() for _ in range(3)], ['a', 'b', 'c'])
+
+    def test_waits_for_first_token_to_recover(self):
+        """Verify acquire() sleeps until the earliest token recovers when all are resting."""
+        for token, delay in (('a', '20'), ('b', '5'), ('c', '40')):
+            self.pool.record(token, _response(429, {'Retry-After': delay}))
+
+        self.assertEqual(self.pool.acquire(), 'b')
+        self.mock_time.sleep.assert_called_once_with(5.0)
+
+    def test_does_not_wait_past_max_wait(self):
+        """Verify a wait longer than RATE_LIMIT_MAX_WAIT_SECONDS returns a token without sleeping."""
+        delay = str(RATE_LIMIT_MAX_WAIT_SECONDS + 10)
+        for token in ('a', 'b', 'c'):
+            self.pool.record(token, _response(429, {'Retry-After': delay}))
+
+        self.assertIn(self.pool.acquire(), ('a', 'b', 'c'))
+        self.mock_time.sleep.assert_not_called()
+
+
+class TestSendAlertPatch(unittest.TestCase):
+    """Test the manual resend of rate-limited alert PATCHes."""
+
+    def setUp(self):
+        pool = MagicMock()
+        pool.acquire.return_value = 'token'
+        for target, value in (('_get_token_pool', MagicMock(return_value=pool)), ('_gh_session', MagicMock())):
+            patcher = patch(f'{MODULE}.{target}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.session = control_center._gh_session
+
+    def test_secondary_rate_limit_is_resent_once(self):
+        """Verify a 403 with Retry-After is sent again and the second response returned."""
+        self.session.patch.side_effect = [_response(403, {'Retry-After': '1'}), _response(200)]
+
+        response = control_center._send_alert_patch('https://api.example/alerts/1', b'{}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.session.patch.call_count, 2)
+
+    def test_429_is_left_to_the_adapter(self):
+        """Verify a 429 is not resent on top of the adapter's own retries."""
+        self.session.patch.return_value = _response(429, {'Retry-After': '1'})
+
+        response = control_center._send_alert_patch('https://api.example/alerts/1', b'{}')
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(self.session.patch.call_count, 1)
+
+
+class TestAlertUpdates(unittest.TestCase):
+    """Test the concurrent claim/unclaim/close helpers."""
+
+    def setUp(self):
+        self.sent = []
+        patcher = patch(f'{MODULE}._send_alert_patch', side_effect=self._send)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.failing = set()
+
+    def _send(self, url, body):
+        alert_number = int(url.rsplit('/', 1)[1])
+        self.sent.append((alert_number, orjson.loads(body)))
+        return _response(500 if alert_number in self.failing else 200)
+
+    def test_empty_list_sends_nothing(self):
+        """Verify no request is made for an empty alert list."""
+        self.assertEqual(control_center.unclaim_github_alerts('owner', 'repo', []), {})
+        self.assertEqual(self.sent, [])
+
+    def test_duplicate_alerts_are_patched_once(self):
+        """Verify an alert listed twice is only updated once."""
+        results = control_center.unclaim_github_alerts('owner', 'repo', [1, 2, 1])
+
+        self.assertEqual(results, {1: True, 2: True})
+        self.assertEqual(sorted(number for number, _ in self.sent), [1, 2])
+
+    def test_failed_update_is_reported(self):
+        """Verify a non-200 response maps the alert to False."""
+        self.failing = {2}
+
+        results = control_center.close_github_alerts('owner', 'repo', [1, 2])
+
+        self.assertEqual(results, {1: True, 2: False})
+
+    def test_request_error_is_reported(self):
+        """Verify a request exception maps the alert to False instead of raising."""
+        with patch(f'{MODULE}._send_alert_patch', side_effect=requests.ConnectionError('reset')):
+            results = control_center.unclaim_github_alerts('owner', 'repo', [3])
+
+        self.assertEqual(results, {3: False})
+
+    def test_close_and_unclaim_sends_each_body(self):
+        """Verify closed and unclaimed alerts get their own PATCH body and result map."""
+        self.failing = {4}
+
+        closed, unclaimed = control_center.close_and_unclaim_github_alerts(
+            'owner', 'repo', [1, 2], [3, 4], reason="won't fix"
+        )
+
+        self.assertEqual(closed, {1: True, 2: True})
+        self.assertEqual(unclaimed, {3: True, 4: False})
+        bodies = dict(self.sent)
+        self.assertEqual(bodies[1], {'state': 'dismissed', 'dismissed_reason': "won't fix"})
+        self.assertEqual(bodies[2], {'state': 'dismissed', 'dismissed_reason': "won't fix"})
+        self.assertEqual(bodies[3], {'assignees': []})
+        self.assertEqual(bodies[4], {'assignees': []})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,315 @@
+"""
+Unit tests for GitHubClient request caching.
+
+These tests verify the conditional-request (ETag / If-None-Match) cache used
+by GitHubClient, without making any real API calls.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+import orjson
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from github_client import GitHubClient, ETAG_CACHE_FILENAME
+
+_RUN = {'tool': {'driver': {'name': 'CodeQL', 'rules': []}}, 'results': []}
+_RUN_V2 = {'tool': {'driver': {'name': 'CodeQL', 'rules': []}}, 'results': [{'ruleId': 'py/sql-injection'}]}
+
+def _response(status_code, body=None, etag=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body
+    response.content = json.dumps(body).encode()
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+class TestConditionalGet(unittest.TestCase):
+    """Test GitHubClient._conditional_get ETag handling."""
+
+    def setUp(self):
+        patcher = patch.dict(os.environ, {}, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = GitHubClient('owner', 'repo', token='test-token', branch='main')
+
+    @patch('github_client.requests.Session.get')
+    def test_first_request_has_no_if_none_match(self, mock_get):
+        """Verify the first request is unconditional and its ETag is stored."""
+        mock_get.return_value = _response(200, [{'number': 1}], etag='"abc"')
+
+        status, body = self.client._conditional_get('https://api.example/x', {'Accept': 'json'})
+
+        self.assertEqual((status, body), (200, [{'number': 1}]))
+        self.assertNotIn('If-None-Match', mock_get.call_args.kwargs['headers'])
+
+    @patch('github_client.requests.Session.get')
+    def test_not_modified_returns_cached_body(self, mock_get):
+        """Verify a 304 response returns the previously cached body."""
+        mock_get.side_effect = [
+            _response(200, [{'number': 1}], etag='"abc"'),
+            _response(304),
+        ]
+
+        self.client._conditional_get('https://api.example/x', {})
+        status, body = self.client._conditional_get('https://api.example/x', {})
+
+        self.assertEqual((status, body), (200, [{'number': 1}]))
+        self.assertEqual(mock_get.call_args.kwargs['headers']['If-None-Match'], '"abc"')
+
+    @patch('github_client.requests.Session.get')
+    def test_not_modified_without_cache_refetches(self, mock_get):
+        """Verify a 304 without a cached body reissues an unconditional request."""
+        mock_get.side_effect = [_response(304), _response(200, {'ok': True})]
+
+        status, body = self.client._conditional_get('https://api.example/x', {})
+
+        self.assertEqual((status, body), (200, {'ok': True}))
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('github_client.requests.Session.get')
+    def test_error_status_returns_none_body(self, mock_get):
+        """Verify non-200 responses are reported with a None body."""
+        mock_get.return_value = _response(403)
+
+        self.assertEqual(self.client._conditional_get('https://api.example/x', {}), (403, None))
+
+    @patch('github_client.requests.Session.get')
+    def test_cache_persists_to_cache_dir(self, mock_get):
+        """Verify ETags are written to and reloaded from SENTINEL_CACHE_DIR."""
+        mock_get.return_value = _response(200, {'ok': True}, etag='"abc"')
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.dict(os.environ, {'SENTINEL_CACHE_DIR': cache_dir}):
+                client = GitHubClient('owner', 'repo', token='test-token', branch='main')
+                client._conditional_get('https://api.example/x', {})
+                client.close()
+                self.assertTrue(os.path.exists(os.path.join(cache_dir, ETAG_CACHE_FILENAME)))
+
+                reloaded = GitHubClient('owner', 'repo', token='test-token', branch='main')
+                self.assertEqual(reloaded._etag_cache, client._etag_cache)
+
+    @patch('github_client.requests.Session.get')
+    def test_pagination_saves_cache_once(self, mock_get):
+        """Verify paging through several pages writes the ETag cache file once."""
+        full_page = [{'number': n} for n in range(100)]
+        mock_get.side_effect = [
+            _response(200, full_page, etag='"p1"'),
+            _response(200, full_page, etag='"p2"'),
+            _response(200, [], etag='"p3"'),
+        ]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.dict(os.environ, {'SENTINEL_CACHE_DIR': cache_dir}):
+                client = GitHubClient('owner', 'repo', token='test-token', branch='main')
+                with patch('github_client.orjson.dumps', wraps=orjson.dumps) as mock_dumps:
+                    self.assertEqual(len(client.get_active_alerts()), 200)
+
+                self.assertEqual(mock_dumps.call_count, 1)
+                reloaded = GitHubClient('owner', 'repo', token='test-token', branch='main')
+                self.assertEqual(len(reloaded._etag_cache), 3)
+
+
+class TestSarifCache(unittest.TestCase):
+    """Test the per-analysis on-disk SARIF cache."""
+
+    @patch('github_client.requests.Session.get')
+    def test_cached_analysis_is_not_refetched(self, mock_get):
+        """Verify a cached analysis is served from disk on the next client."""
+        mock_get.return_value = _response(200, {'runs': [_RUN]})
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.dict(os.environ, {'SENTINEL_CACHE_DIR': cache_dir}):
+                client = GitHubClient('owner', 'repo', token='test-token', branch='main')
+                self.assertEqual(client._get_analysis_sarif('/language:python', 7), [_RUN])
+
+                reloaded = GitHubClient('owner', 'repo', token='test-token', branch='main')
+                self.assertEqual(reloaded._get_analysis_sarif('/language:python', 7), [_RUN])
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch('github_client.requests.Session.get')
+    def test_no_cache_dir_always_fetches(self, mock_get):
+        """Verify SARIF is fetched every time when no cache directory is set."""
+        mock_get.return_value = _response(200, {'runs': []})
+        client = GitHubClient('owner', 'repo', token='test-token', branch='main')
+
+        client._get_analysis_sarif('/language:python', 7)
+        client._get_analysis_sarif('/language:python', 7)
+
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class TestSarifTrim(unittest.TestCase):
+    """Test that downloaded SARIF runs keep only the sections the parser reads."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch('github_client.requests.Session.get')
+    def test_run_is_trimmed(self, mock_get):
+        """Verify rule help texts and run metadata are dropped."""
+        rule = {
+            'id': 'py/sql-injection',
+            'properties': {'security-severity': '8.8'},
+            'defaultConfiguration': {'level': 'error'},
+            'help': {'markdown': '# SQL injection'},
+            'fullDescription': {'text': 'Building a SQL query from user input.'},
+        }
+        result = {'ruleId': 'py/sql-injection', 'message': {'text': 'query'}}
+        run = {
+            'tool': {
+                'driver': {'name': 'CodeQL', 'version': '2.15.0', 'rules': [rule], 'notifications': [{}]},
+                'extensions': [{'name': 'codeql/python-queries', 'rules': [rule]}],
+            },
+            'results': [result],
+            'artifacts': [{'location': {'uri': 'app.py'}}],
+            'invocations': [{'executionSuccessful': True}],
+        }
+        mock_get.return_value = _response(200, {'runs': [run]})
+        client = GitHubClient('owner', 'repo', token='test-token', branch='main')
+
+        trimmed_rule = {
+            'id': 'py/sql-injection',
+            'properties': {'security-severity': '8.8'},
+            'defaultConfiguration': {'level': 'error'},
+        }
+        self.assertEqual(client._get_analysis_sarif('/language:python', 7), [{
+            'tool': {
+                'driver': {'name': 'CodeQL', 'version': '2.15.0', 'rules': [trimmed_rule]},
+                'extensions': [{'name': 'codeql/python-queries', 'rules': [trimmed_rule]}],
+            },
+            'results': [result],
+        }])
+
+
+class TestSarifMemo(unittest.TestCase):
+    """Test the in-memory merged SARIF kept per branch."""
+
+    def setUp(self):
+        patcher = patch.dict(os.environ, {}, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = GitHubClient('owner', 'repo', token='test-token', branch='main')
+
+    @patch('github_client.requests.Session.get')
+    def test_repeated_calls_fetch_once(self, mock_get):
+        """Verify a second call returns the merged SARIF without any request."""
+        mock_get.side_effect = [
+            _response(200, [{'category': '/language:python', 'id': 7}]),
+            _response(200, {'runs': [_RUN]}),
+        ]
+
+        first = self.client.get_sarif_data()
+        second = self.client.get_sarif_data()
+
+        self.assertEqual(first['runs'], [_RUN])
+        self.assertIs(second, first)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('github_client.requests.Session.get')
+    def test_refresh_bypasses_memo(self, mock_get):
+        """Verify refresh=True downloads the SARIF again."""
+        mock_get.side_effect = [
+            _response(200, [{'category': '/language:python', 'id': 7}]),
+            _response(200, {'runs': [_RUN]}),
+            _response(200, [{'category': '/language:python', 'id': 8}]),
+            _response(200, {'runs': [_RUN_V2]}),
+        ]
+
+        self.client.get_sarif_data()
+        refreshed = self.client.get_sarif_data(refresh=True)
+
+        self.assertEqual(refreshed['runs'], [_RUN_V2])
+        self.assertEqual(mock_get.call_count, 4)
+
+    @patch('github_client.requests.Session.get')
+    def test_empty_result_is_not_kept(self, mock_get):
+        """Verify a failed fetch is retried on the next call."""
+        mock_get.return_value = _response(500)
+
+        self.assertEqual(self.client.get_sarif_data(), {})
+        self.assertEqual(self.client.get_sarif_data(), {})
+
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class TestGetActiveAlertsPagination(unittest.TestCase):
+    """Test that get_active_alerts follows every page of results."""
+
+    def setUp(self):
+        patcher = patch.dict(os.environ, {}, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = GitHubClient('owner', 'repo', token='test-token', branch='main')
+
+    @patch('github_client.requests.Session.get')
+    def test_fetches_until_short_page(self, mock_get):
+        """Verify pages are requested until one returns fewer than per_page items."""
+        full_page = [{'number': n} for n in range(100)]
+        mock_get.side_effect = [_response(200, full_page), _response(200, [{'number': 100}])]
+
+        alerts = self.client.get_active_alerts()
+
+        self.assertEqual(len(alerts), 101)
+        pages = [call.kwargs['params']['page'] for call in mock_get.call_args_list]
+        self.assertEqual(pages, [1, 2])
+
+    @patch('github_client.requests.Session.get')
+    def test_iter_active_alerts_fetches_pages_lazily(self, mock_get):
+        """Verify the second page is only requested once the first is consumed."""
+        full_page = [{'number': n} for n in range(100)]
+        mock_get.side_effect = [_response(200, full_page), _response(200, [])]
+
+        stream = self.client.iter_active_alerts()
+        self.assertEqual(next(stream), {'number': 0})
+        self.assertEqual(mock_get.call_count, 1)
+
+        self.assertEqual(len(list(stream)), 99)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('github_client.requests.Session.get')
+    def test_failed_page_returns_empty(self, mock_get):
+        """Verify a failing page makes get_active_alerts return an empty result."""
+        full_page = [{'number': n} for n in range(100)]
+        mock_get.side_effect = [_response(200, full_page), _response(500)]
+
+        self.assertEqual(self.client.get_active_alerts(), {})
+
+
+
+class TestClientSession(unittest.TestCase):
+    """Test the lifetime of GitHubClient's pooled session."""
+
+    def setUp(self):
+        patcher = patch.dict(os.environ, {}, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('github_client.requests.Session.get')
+    def test_requests_share_one_session(self, mock_get):
+        """Verify every request of a client goes through the same session."""
+        mock_get.return_value = _response(200, [])
+        client = GitHubClient('owner', 'repo', token='test-token', branch='main')
+        session = client._session
+
+        client.get_active_alerts()
+        client._get_latest_analysis_ids_by_category()
+
+        self.assertIs(client._session, session)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('github_client.requests.Session.close')
+    def test_context_manager_closes_session(self, mock_close):
+        """Verify leaving the with block closes the pooled session."""
+        with GitHubClient('owner', 'repo', token='test-token', branch='main') as client:
+            self.assertIsInstance(client, GitHubClient)
+            mock_close.assert_not_called()
+
+        mock_close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
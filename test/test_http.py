@@ -0,0 +1,110 @@
+"""
+Unit tests for the shared HTTP transport helpers.
+
+These tests verify that KeepAliveTTLAdapter drops idle pooled connections
+and follows the server's advertised keep-alive timeout, without opening any
+real connections.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.devin.DO_http import KeepAliveTTLAdapter, create_pooled_session
+
+MODULE = 'scripts.devin.DO_http'
+
+
+def _built_response(keep_alive=None):
+    response = requests.Response()
+    if keep_alive:
+        response.headers['Keep-Alive'] = keep_alive
+    return response
+
+
+class TestKeepAliveTTLAdapter(unittest.TestCase):
+    """Test KeepAliveTTLAdapter idle-connection handling."""
+
+    def setUp(self):
+        patcher = patch(f'{MODULE}.time')
+        self.mock_time = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_time.monotonic.return_value = 100.0
+        self.adapter = KeepAliveTTLAdapter(idle_ttl=30)
+        self.adapter.poolmanager = MagicMock()
+
+        send_patcher = patch.object(HTTPAdapter, 'send', return_value=MagicMock())
+        self.mock_send = send_patcher.start()
+        self.addCleanup(send_patcher.stop)
+
+    def test_recent_pool_is_reused(self):
+        """Verify connections idle for less than the TTL are kept."""
+        self.mock_time.monotonic.return_value = 120.0
+
+        self.adapter.send(MagicMock())
+
+        self.adapter.poolmanager.clear.assert_not_called()
+        self.mock_send.assert_called_once()
+
+    def test_idle_pool_is_cleared(self):
+        """Verify connections idle for longer than the TTL are dropped before sending."""
+        self.mock_time.monotonic.return_value = 131.0
+
+        self.adapter.send(MagicMock())
+
+        self.adapter.poolmanager.clear.assert_called_once()
+        self.mock_send.assert_called_once()
+
+    def test_send_resets_idle_clock(self):
+        """Verify each request restarts the idle period."""
+        self.mock_time.monotonic.return_value = 120.0
+        self.adapter.send(MagicMock())
+        self.mock_time.monotonic.return_value = 145.0
+        self.adapter.send(MagicMock())
+
+        self.adapter.poolmanager.clear.assert_not_called()
+
+    def test_server_keep_alive_lowers_ttl(self):
+        """Verify a Keep-Alive timeout shorter than the TTL lowers it to just under the timeout."""
+        with patch.object(HTTPAdapter, 'build_response', return_value=_built_response('timeout=5, max=1000')):
+            self.adapter.build_response(MagicMock(), MagicMock())
+
+        self.assertEqual(self.adapter.idle_ttl, 4)
+
+    def test_longer_server_keep_alive_keeps_ttl(self):
+        """Verify a Keep-Alive timeout longer than the TTL does not raise it."""
+        with patch.object(HTTPAdapter, 'build_response', return_value=_built_response('timeout=120')):
+            self.adapter.build_response(MagicMock(), MagicMock())
+
+        self.assertEqual(self.adapter.idle_ttl, 30)
+
+    def test_response_without_keep_alive_keeps_ttl(self):
+        """Verify responses without a Keep-Alive header leave the TTL unchanged."""
+        with patch.object(HTTPAdapter, 'build_response', return_value=_built_response()):
+            self.adapter.build_response(MagicMock(), MagicMock())
+
+        self.assertEqual(self.adapter.idle_ttl, 30)
+
+
+class TestCreatePooledSession(unittest.TestCase):
+    """Test create_pooled_session."""
+
+    def test_mounts_keep_alive_adapter(self):
+        """Verify HTTPS requests go through a KeepAliveTTLAdapter with the given headers."""
+        session = create_pooled_session(headers={'Accept': 'application/json'}, max_retries=2)
+        self.addCleanup(session.close)
+
+        adapter = session.get_adapter('https://api.github.com/')
+        self.assertIsInstance(adapter, KeepAliveTTLAdapter)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertEqual(session.headers['Accept'], 'application/json')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,294 @@
+"""
+Unit tests for Devin session polling.
+
+These tests drive poll_session_status() with a fake clock and mocked status
+sources, covering the retry backoff, the fatal-error exit, the exponential
+and adaptive poll schedules, the shared session-list snapshot, and the
+wake-up events used to end a wait early. No real API calls are made.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scripts.devin import DO_session as session_module
+from scripts.devin.DO_models import SessionStatus
+
+MODULE = 'scripts.devin.DO_session'
+
+
+class _FakeClock:
+    """Monotonic clock that only moves when a poll wait is simulated."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.waits = []
+
+    def monotonic(self):
+        return self.now
+
+    def waiter(self, stop_after):
+        """Return a _wait_for_next_poll stand-in that reports cancellation after stop_after waits."""
+        def wait(session_id, seconds):
+            self.waits.append(round(seconds, 1))
+            self.now += seconds
+            return len(self.waits) >= stop_after
+        return wait
+
+
+class _PollTestCase(unittest.TestCase):
+    """Patch the clock, jitter, history and background monitor for every test."""
+
+    def setUp(self):
+        self.clock = _FakeClock()
+        mock_time = MagicMock()
+        mock_time.monotonic.side_effect = self.clock.monotonic
+        self.history = []
+        for target, value in (
+            ('time', mock_time),
+            ('POLL_JITTER_SECONDS', 0),
+            ('_ensure_session_monitor', MagicMock()),
+            ('_load_poll_history', lambda: list(self.history)),
+            ('_record_completion_time', MagicMock()),
+            ('find_session_pull_request', MagicMock(return_value=None)),
+        ):
+            patcher = patch(f'{MODULE}.{target}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def poll(self, snapshots, stop_after=6, **kwargs):
+        """Poll session 's1', serving each status check from the next snapshot entry."""
+        entries = iter(snapshots)
+        with patch.object(session_module._session_cache, 'get', side_effect=lambda session_id: dict(next(entries))), \
+                patch(f'{MODULE}._wait_for_next_poll', self.clock.waiter(stop_after)):
+            return session_module.poll_session_status('s1', **kwargs)
+
+
+class TestPollResults(_PollTestCase):
+    """Test how status responses end the polling loop."""
+
+    def test_finished_session_returns_without_waiting(self):
+        """Verify a finished session is reported on the first check with the batch details."""
+        result = self.poll([{'status_enum': 'finished'}], batch_id='b1', alert_numbers=[1, 2])
+
+        self.assertEqual(result.status, SessionStatus.SUCCESS)
+        self.assertEqual((result.batch_id, result.alert_numbers), ('b1', [1, 2]))
+        self.assertEqual(self.clock.waits, [])
+
+    def test_reported_pull_request_skips_github_lookup(self):
+        """Verify a PR in the Devin payload is used without searching GitHub."""
+        snapshot = {'status_enum': 'running', 'pull_request': {'url': 'https://github.com/o/r/pull/7'}}
+
+        result = self.poll([snapshot], owner='o', repo='r')
+
+        self.assertEqual(result.status, SessionStatus.SUCCESS)
+        self.assertEqual(result.pr_url, 'https://github.com/o/r/pull/7')
+        session_module.find_session_pull_request.assert_not_called()
+
+    def test_github_lookup_finds_unreported_pull_request(self):
+        """Verify GitHub is searched once a blocked session reports no PR."""
+        session_module.find_session_pull_request.return_value = 'https://github.com/o/r/pull/8'
+
+        result = self.poll([{'status_enum': 'blocked'}], owner='o', repo='r')
+
+        self.assertEqual(result.status, SessionStatus.SUCCESS)
+        self.assertEqual(result.pr_url, 'https://github.com/o/r/pull/8')
+        session_module.find_session_pull_request.assert_called_once_with('o', 'r', 's1')
+
+    def test_running_session_skips_github_lookup(self):
+        """Verify GitHub is not searched while the session is still running."""
+        snapshots = [{'status_enum': 'running', 'status_message': 'same'}] * 3 + [{'status_enum': 'finished'}]
+
+        result = self.poll(snapshots, owner='o', repo='r', stagnation_threshold=10_000)
+
+        self.assertEqual(result.status, SessionStatus.SUCCESS)
+        session_module.find_session_pull_request.assert_called_once_with('o', 'r', 's1')
+
+    def test_stagnant_session_is_stuck(self):
+        """Verify a session without new messages is marked stuck after the threshold."""
+        result = self.poll([{'status_enum': 'running', 'status_message': 'same'}] * 10, stop_after=10, stagnation_threshold=100)
+
+        self.assertEqual(result.status, SessionStatus.STUCK)
+        self.assertGreater(self.clock.now, 100)
+
+
+class TestStatusCheckFailures(_PollTestCase):
+    """Test retries of failed per-session status checks."""
+
+    def test_fatal_client_error_stops_polling(self):
+        """Verify a 4xx status check ends polling immediately with a failure."""
+        with patch.object(session_module._session_cache, 'get', return_value=None), \
+                patch(f'{MODULE}._fetch_session_status', return_value=(None, 404)) as mock_fetch, \
+                patch(f'{MODULE}._wait_for_next_poll', self.clock.waiter(5)):
+            result = session_module.poll_session_status('s1')
+
+        self.assertEqual(result.status, SessionStatus.FAILURE)
+        self.assertIn('HTTP 404', result.error_message)
+        self.assertEqual(mock_fetch.call_count, 1)
+        self.assertEqual(self.clock.waits, [])
+
+    def test_transient_errors_back_off_then_recover(self):
+        """Verify 5xx and rate-limit failures are retried with a growing wait."""
+        responses = [(None, 503), (None, 429), (None, None), ({'status_enum': 'finished'}, 200)]
+        with patch.object(session_module._session_cache, 'get', return_value=None), \
+                patch(f'{MODULE}._fetch_session_status', side_effect=responses), \
+                patch(f'{MODULE}._wait_for_next_poll', self.clock.waiter(5)):
+            result = session_module.poll_session_status('s1')
+
+        self.assertEqual(result.status, SessionStatus.SUCCESS)
+        self.assertEqual(self.clock.waits, [13.0, 16.9, 22.0])
+
+
+class TestPollSchedule(_PollTestCase):
+    """Test the waits between status checks of a running session."""
+
+    def test_exponential_backoff_caps_at_poll_interval(self):
+        """Verify waits double from the initial interval up to poll_interval."""
+        self.poll([{'status_enum': 'running', 'status_message': 'same'}] * 6, stagnation_threshold=10_000)
+
+        self.assertEqual(self.clock.waits, [10, 20, 40, 80, 150, 150])
+
+    def test_activity_resets_backoff(self):
+        """Verify a new status message drops the wait back to the initial interval."""
+        messages = ['a', 'a', 'a', 'b', 'b', 'b']
+        self.poll([{'status_enum': 'running', 'status_message': m} for m in messages], stagnation_threshold=10_000)
+
+        self.assertEqual(self.clock.waits, [10, 20, 40, 10, 20, 40])
+
+    def test_adaptive_schedule_follows_history(self):
+        """Verify polls follow recorded completion times, then fall back to poll_interval."""
+        self.history = [float(t) for t in range(10, 110, 10)]
+
+        self.poll([{'status_enum': 'running', 'status_message': 'same'}] * 6, stagnation_threshold=10_000)
+
+        self.assertEqual(self.clock.waits, [20, 20, 20, 30, 150, 150])
+
+    def test_schedule_needs_enough_samples(self):
+        """Verify the adaptive schedule is only used with POLL_HISTORY_MIN_SAMPLES completions."""
+        self.assertEqual(session_module._adaptive_poll_schedule([30.0] * 3, 900, 150), [])
+        self.assertEqual(session_module._adaptive_poll_schedule([30.0] * 10, 900, 150), [30.0])
+
+
+class TestSessionCache(unittest.TestCase):
+    """Test the shared session-list snapshot."""
+
+    def setUp(self):
+        patcher = patch.dict(session_module._session_wakeups, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sessions = [
+            {'session_id': 's1', 'status_enum': 'finished'},
+            {'session_id': 's2', 'status_enum': 'running'},
+            {'session_id': 's3', 'status_enum': 'working', 'pull_request': {'url': 'https://github.com/o/r/pull/1'}},
+        ]
+
+    def test_snapshot_serves_every_session_from_one_call(self):
+        """Verify lookups and the active count within the TTL share one list call."""
+        cache = session_module._SessionCache(ttl=60)
+        with patch(f'{MODULE}._fetch_session_list', return_value=self.sessions) as mock_list:
+            self.assertEqual(cache.get('s2')['status_enum'], 'running')
+            self.assertIsNone(cache.get('missing'))
+            self.assertEqual(cache.active_count(), 2)
+
+        self.assertEqual(mock_list.call_count, 1)
+
+    def test_expired_snapshot_is_refreshed(self):
+        """Verify the snapshot is reloaded once it is older than the TTL."""
+        cache = session_module._SessionCache(ttl=0)
+        with patch(f'{MODULE}._fetch_session_list', return_value=self.sessions) as mock_list:
+            cache.get('s1')
+            cache.get('s1')
+
+        self.assertEqual(mock_list.call_count, 2)
+
+    def test_refresh_wakes_finished_and_pr_sessions(self):
+        """Verify a refresh wakes pollers of sessions that finished or opened a PR."""
+        for session_id in ('s1', 's2', 's3'):
+            session_module._session_wakeups[session_id] = threading.Event()
+        cache = session_module._SessionCache(ttl=60)
+
+        with patch(f'{MODULE}._fetch_session_list', return_value=self.sessions):
+            cache.refresh()
+
+        woken = {sid for sid, event in session_module._session_wakeups.items() if event.is_set()}
+        self.assertEqual(woken, {'s1', 's3'})
+
+    def test_readers_are_not_blocked_by_a_refresh(self):
+        """Verify the previous snapshot is served while another caller fetches the list."""
+        cache = session_module._SessionCache(ttl=0)
+        with patch(f'{MODULE}._fetch_session_list', return_value=self.sessions):
+            cache.get('s1')
+
+        fetching, release = threading.Event(), threading.Event()
+
+        def slow_fetch():
+            fetching.set()
+            release.wait(5)
+            return [{'session_id': 's1', 'status_enum': 'running'}]
+
+        with patch(f'{MODULE}._fetch_session_list', side_effect=slow_fetch) as mock_list:
+            refresher = threading.Thread(target=cache.refresh)
+            refresher.start()
+            self.assertTrue(fetching.wait(5))
+
+            self.assertEqual(cache.get('s1')['status_enum'], 'finished')
+
+            release.set()
+            refresher.join(5)
+
+        self.assertEqual(mock_list.call_count, 1)
+        self.assertEqual(cache._by_id['s1']['status_enum'], 'running')
+
+
+class TestWakeups(unittest.TestCase):
+    """Test early wake-ups of waiting pollers and the snapshot monitor."""
+
+    def setUp(self):
+        patcher = patch.dict(session_module._session_wakeups, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(session_module._polling_cancelled.clear)
+
+    def test_notify_ends_wait_early(self):
+        """Verify notify_session_event() wakes a waiting poller without cancelling it."""
+        session_module._session_wakeups['s1'] = threading.Event()
+        timer = threading.Timer(0.05, session_module.notify_session_event, args=('s1',))
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        started = time.monotonic()
+        cancelled = session_module._wait_for_next_poll('s1', 10)
+
+        self.assertFalse(cancelled)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertFalse(session_module._session_wakeups['s1'].is_set())
+
+    def test_cancel_polling_ends_wait(self):
+        """Verify cancel_polling() wakes a waiting poller and reports cancellation."""
+        session_module._session_wakeups['s1'] = threading.Event()
+        timer = threading.Timer(0.05, session_module.cancel_polling)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        self.assertTrue(session_module._wait_for_next_poll('s1', 10))
+
+    def test_monitor_refreshes_until_no_session_is_polled(self):
+        """Verify the monitor refreshes the snapshot while pollers exist, then exits."""
+        session_module._session_wakeups['s1'] = threading.Event()
+        refresh = MagicMock(side_effect=lambda: session_module._session_wakeups.pop('s1'))
+
+        with patch(f'{MODULE}.SESSION_LIST_CACHE_TTL_SECONDS', 0.01), \
+                patch.object(session_module._session_cache, 'refresh', refresh):
+            session_module._monitor_sessions()
+
+        refresh.assert_called_once()
+        self.assertIsNone(session_module._monitor_thread)
+
+
+if __name__ == '__main__':
+    unittest.main()